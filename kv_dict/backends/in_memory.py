@@ -2,44 +2,107 @@
 
 from __future__ import annotations
 
-import asyncio
+from bisect import bisect_left
 from typing import override
 
 from .protocol import Backend
 
 
 class InMemoryAsyncBackend(Backend):
-    """Simple in-memory backend for local development and tests."""
+    """Simple in-memory backend for local development and tests.
+
+    Operations never await while touching the store, so each one runs atomically on the event loop
+    without an ``asyncio.Lock``. Writes stay O(1): adding or removing a key only drops the sorted key
+    index. The first listing after such a change scans the store like a plain dict would; a second listing
+    with no change in between builds the index, and later listings bisect it to the prefix range.
+    """
 
     def __init__(self) -> None:
         super().__init__()
-        self._store: dict[str, str] = {}
-        self._lock = asyncio.Lock()
+        self._store: dict[str, str | bytes] = {}
+        self._sorted_keys: list[str] | None = None
+        self._scanned_since_change = False
+
+    def _keys_changed(self) -> None:
+        self._sorted_keys = None
+        self._scanned_since_change = False
 
     @override
-    async def get(self, key: str) -> str | None:
+    async def get(self, key: str) -> str | bytes | None:
         """Return raw value for key, or None when key does not exist."""
-        async with self._lock:
-            return self._store.get(key)
+        return self._store.get(key)
+
+    @override
+    async def exists(self, key: str) -> bool:
+        """Return True when key exists."""
+        return key in self._store
 
     @override
-    async def set(self, key: str, value: str) -> None:
+    async def exists_many(self, keys: list[str]) -> list[bool]:
+        """Return whether each key exists, in order."""
+        return [key in self._store for key in keys]
+
+    @override
+    async def set(self, key: str, value: str | bytes) -> None:
         """Store raw value for key."""
-        async with self._lock:
-            self._store[key] = value
+        if key not in self._store:
+            self._keys_changed()
+        self._store[key] = value
+
+    @override
+    async def get_many(self, keys: list[str]) -> list[str | bytes | None]:
+        """Return raw values for keys in order, with None for missing keys."""
+        store = self._store
+        return [store.get(key) for key in keys]
+
+    @override
+    async def set_many(self, items: list[tuple[str, str | bytes]]) -> None:
+        """Store several raw key/value pairs."""
+        store = self._store
+        for key, value in items:
+            if key not in store:
+                self._keys_changed()
+            store[key] = value
+
+    @override
+    async def set_if_absent(self, key: str, value: str | bytes) -> bool:
+        """Store value for key only when key does not exist."""
+        if key in self._store:
+            return False
+        await self.set(key, value)
+        return True
 
     @override
     async def delete(self, key: str) -> None:
         """Delete key if present."""
-        async with self._lock:
-            _ = self._store.pop(key, None)
+        if self._store.pop(key, None) is not None:
+            self._keys_changed()
+
+    @override
+    async def delete_many(self, keys: list[str]) -> None:
+        """Delete several keys, ignoring those that are not present."""
+        store = self._store
+        removed = [key for key in keys if store.pop(key, None) is not None]
+        if removed:
+            self._keys_changed()
 
     @override
     async def list_keys(self, prefix: str) -> list[str]:
         """List all keys beginning with prefix in sorted order."""
-        async with self._lock:
-            matching = [key for key in self._store if key.startswith(prefix)]
-        return sorted(matching)
+        sorted_keys = self._sorted_keys
+        if sorted_keys is None:
+            # Sorting every key only pays off once the key set has stayed unchanged across two listings.
+            if not self._scanned_since_change:
+                self._scanned_since_change = True
+                return sorted(key for key in self._store if key.startswith(prefix))
+            sorted_keys = self._sorted_keys = sorted(self._store)
+        keys: list[str] = []
+        for index in range(bisect_left(sorted_keys, prefix), len(sorted_keys)):
+            key = sorted_keys[index]
+            if not key.startswith(prefix):
+                break
+            keys.append(key)
+        return keys
 
     @override
     async def close(self) -> None:
@@ -20,6 +20,10 @@ def _is_not_found_error(error: Exception) -> bool:
     return error.__class__.__name__ in _NOT_FOUND_ERROR_NAMES
 
 
+def _is_key_exists_error(error: Exception) -> bool:
+    return error.__class__.__name__ == "KeyWrongLastSequenceError"
+
+
 class NatsBackend(Backend):
     """NATS JetStream KV backend.
 
@@ -86,8 +90,11 @@ class NatsBackend(Backend):
         return self._kv
 
     @override
-    async def get(self, key: str) -> str | None:
-        """Return raw value for key, or None when key does not exist."""
+    async def get(self, key: str) -> str | bytes | None:
+        """Return the stored bytes for key, or None when key does not exist.
+
+        Values are returned undecoded; ``RemoteKVMapping`` decoders such as ``json.loads`` accept bytes.
+        """
         kv = await self._ensure_kv()
         try:
             entry = await kv.get(key)
@@ -96,16 +103,25 @@ class NatsBackend(Backend):
                 return None
             raise
 
-        value = entry.value
-        if isinstance(value, bytes):
-            return value.decode()
-        return value
+        return entry.value
 
     @override
-    async def set(self, key: str, value: str) -> None:
+    async def set(self, key: str, value: str | bytes) -> None:
         """Store raw value for key."""
         kv = await self._ensure_kv()
-        await kv.put(key, value.encode())
+        await kv.put(key, value.encode() if isinstance(value, str) else value)
+
+    @override
+    async def set_if_absent(self, key: str, value: str | bytes) -> bool:
+        """Store value for key with ``kv.create``, returning True when it was stored."""
+        kv = await self._ensure_kv()
+        try:
+            await kv.create(key, value.encode() if isinstance(value, str) else value)
+        except Exception as error:
+            if _is_key_exists_error(error):
+                return False
+            raise
+        return True
 
     @override
     async def delete(self, key: str) -> None:
@@ -2,19 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
 
 
 class Backend(ABC):
     """Async key-value backend interface."""
 
     @abstractmethod
-    async def get(self, key: str) -> str | None:
+    async def get(self, key: str) -> str | bytes | None:
         """Return raw value for key, or None when key does not exist."""
 
     @abstractmethod
-    async def set(self, key: str, value: str) -> None:
-        """Store raw value for key."""
+    async def set(self, key: str, value: str | bytes) -> None:
+        """Store raw value for key.
+
+        Values may be ``bytes`` (for example from ``orjson.dumps``); backends must not require ``str``.
+        """
 
     @abstractmethod
     async def delete(self, key: str) -> None:
@@ -27,3 +36,84 @@ class Backend(ABC):
     @abstractmethod
     async def close(self) -> None:
         """Close any backend resources."""
+
+    async def iter_keys(self, prefix: str) -> AsyncIterator[str]:
+        """Yield keys beginning with prefix, in no particular order.
+
+        The default materializes ``list_keys``; backends override this to stream keys from the server.
+        """
+        for key in await self.list_keys(prefix):
+            yield key
+
+    async def list_top_level(self, prefix: str, sep: str) -> list[str]:
+        """Return the distinct first path segments after prefix, in no particular order.
+
+        The default streams ``iter_keys`` and deduplicates locally, holding only the distinct segments;
+        backends that can group keys server-side override this to avoid transferring every key. Keys that do
+        not literally start with prefix are skipped, in case ``iter_keys`` matched it as a pattern.
+        """
+        segments: set[str] = set()
+        prefix_len = len(prefix)
+        async for key in self.iter_keys(prefix):
+            if not key.startswith(prefix):
+                continue
+            segment = key[prefix_len:].split(sep, 1)[0]
+            if segment:
+                segments.add(segment)
+        return list(segments)
+
+    async def count_top_level(self, prefix: str, sep: str) -> int:
+        """Return the number of distinct first path segments after prefix.
+
+        The default counts ``list_top_level``; backends that can count server-side override this so only the
+        number crosses the wire.
+        """
+        return len(await self.list_top_level(prefix, sep))
+
+    async def scan_items(self, prefix: str) -> list[tuple[str, str | bytes]]:
+        """Return ``(key, value)`` pairs for every key beginning with prefix, in no particular order.
+
+        The default lists keys and then reads them with ``get_many``; backends override this to fuse the two.
+        """
+        keys = [key async for key in self.iter_keys(prefix) if key.startswith(prefix)]
+        values = await self.get_many(keys)
+        return [(key, value) for key, value in zip(keys, values, strict=True) if value is not None]
+
+    async def exists(self, key: str) -> bool:
+        """Return True when key exists.
+
+        The default reads the value with ``get``; backends override this with a check that transfers no value.
+        """
+        return await self.get(key) is not None
+
+    async def exists_many(self, keys: list[str]) -> list[bool]:
+        """Return whether each key exists, in order.
+
+        The default issues concurrent ``exists`` checks; backends override this with a native bulk lookup.
+        """
+        return list(await asyncio.gather(*(self.exists(key) for key in keys)))
+
+    async def get_many(self, keys: list[str]) -> list[str | bytes | None]:
+        """Return raw values for keys in order, with None for missing keys.
+
+        The default issues concurrent single-key reads; backends override this with a native bulk read.
+        """
+        return list(await asyncio.gather(*(self.get(key) for key in keys)))
+
+    async def set_if_absent(self, key: str, value: str | bytes) -> bool:
+        """Store value for key only when key does not exist, returning True when it was stored.
+
+        The default checks and writes in two steps; backends override this with an atomic conditional write.
+        """
+        if await self.get(key) is not None:
+            return False
+        await self.set(key, value)
+        return True
+
+    async def set_many(self, items: list[tuple[str, str | bytes]]) -> None:
+        """Store several raw key/value pairs."""
+        _ = await asyncio.gather(*(self.set(key, value) for key, value in items))
+
+    async def delete_many(self, keys: list[str]) -> None:
+        """Delete several keys, ignoring those that are not present."""
+        _ = await asyncio.gather(*(self.delete(key) for key in keys))
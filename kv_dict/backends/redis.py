@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any, override
+import asyncio
+import re
+from typing import TYPE_CHECKING, Any, override
 
 
 try:
@@ -13,6 +15,18 @@ except ImportError:  # pragma: no cover - exercised when dependency is absent
 from .protocol import Backend
 
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+
+_GLOB_SPECIAL = re.compile(r"([*?\[\]\\])")
+
+
+def _glob_escape(value: str) -> str:
+    # ``SCAN MATCH`` takes a glob, so prefix characters such as ``*`` or ``[`` must not act as wildcards.
+    return _GLOB_SPECIAL.sub(r"\\\1", value)
+
+
 def _normalize_string(value: str | bytes | None) -> str | None:
     if value is None:
         return None
@@ -24,7 +38,21 @@ def _normalize_string(value: str | bytes | None) -> str | None:
 class RedisBackend(Backend):
     """Redis-compatible async backend using ``redis.asyncio`` client APIs."""
 
-    def __init__(self, url: str = "redis://localhost:6379/0", *, client: Any | None = None) -> None:
+    def __init__(  # noqa: PLR0913
+        self,
+        url: str = "redis://localhost:6379/0",
+        *,
+        client: Any | None = None,
+        auto_pipeline: bool = False,
+        max_connections: int = 16,
+        socket_keepalive: bool = True,
+        health_check_interval: float = 30,
+        socket_timeout: float | None = None,
+        scan_count: int = 1000,
+        mget_chunk_size: int = 500,
+        decode_responses: bool = True,
+        unlink: bool = True,
+    ) -> None:
         """Create a backend from URL or an injected async client.
 
         Parameters
@@ -32,10 +60,42 @@ class RedisBackend(Backend):
         url
             Redis connection URL used when ``client`` is not provided.
         client
-            Optional injected client with ``get/set/delete/scan_iter/aclose`` API.
+            Optional injected client with ``get/set/delete/mget/mset/scan_iter/aclose`` API.
+        auto_pipeline
+            When True, single-key ``get/set/delete`` calls issued in the same event-loop iteration are
+            queued and sent as one non-transactional pipeline, so concurrent callers share a round-trip.
+            Requires a client with a ``pipeline`` method.
+        max_connections
+            Size of the blocking connection pool created when ``client`` is not provided. Concurrent commands
+            run on separate connections up to this limit and then wait for a free one.
+        socket_keepalive
+            Enable TCP keepalive on pooled connections so idle ones are not silently dropped by the network.
+        health_check_interval
+            Seconds a pooled connection may sit idle before it is checked with ``PING`` on its next use, so a
+            dead connection is replaced before a command fails on it. ``0`` disables the check.
+        socket_timeout
+            Seconds to wait on a socket read or write before failing the command. ``None`` waits indefinitely.
+        scan_count
+            ``COUNT`` hint passed to ``SCAN`` so large keyspaces are listed in fewer round-trips than with the
+            server default of 10.
+        mget_chunk_size
+            Number of scanned keys read per ``MGET`` in ``scan_items``; chunks are read concurrently.
+        decode_responses
+            When False, values are returned as the raw ``bytes`` Redis sent, skipping a UTF-8 decode per value.
+            Pair this with a bytes-native decoder such as ``orjson.loads``. Keys are always returned as ``str``.
+        unlink
+            When True, deletes use ``UNLINK`` so the server reclaims memory in the background instead of
+            blocking on large subtrees. Set to False for servers older than Redis 4.0, which only support ``DEL``.
         """
         super().__init__()
         self._url = url
+        self._auto_pipeline = auto_pipeline
+        self._scan_count = scan_count
+        self._mget_chunk_size = mget_chunk_size
+        self._decode_responses = decode_responses
+        self._delete_command = "unlink" if unlink else "delete"
+        self._queued: list[tuple[str, tuple[Any, ...], asyncio.Future[Any]]] = []
+        self._flush_task: asyncio.Task[None] | None = None
         if client is not None:
             self._client = client
             return
@@ -44,32 +104,128 @@ class RedisBackend(Backend):
             msg = "redis dependency is required for RedisBackend; install with `uv add redis`"
             raise RuntimeError(msg)
 
-        self._client = redis_async.from_url(url, decode_responses=True)
+        pool = redis_async.BlockingConnectionPool.from_url(
+            url,
+            max_connections=max_connections,
+            decode_responses=decode_responses,
+            socket_keepalive=socket_keepalive,
+            health_check_interval=health_check_interval,
+            socket_timeout=socket_timeout,
+        )
+        self._client = redis_async.Redis.from_pool(pool)
+
+    async def _execute(self, command: str, *args: Any) -> Any:
+        if not self._auto_pipeline:
+            return await getattr(self._client, command)(*args)
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Any] = loop.create_future()
+        self._queued.append((command, args, future))
+        if self._flush_task is None:
+            # The flush task first runs on the next loop iteration, after every coroutine that is already
+            # scheduled has had the chance to queue its command.
+            self._flush_task = loop.create_task(self._flush_queued())
+        return await future
+
+    async def _flush_queued(self) -> None:
+        queued, self._queued = self._queued, []
+        self._flush_task = None
+        pipe = self._client.pipeline(transaction=False)
+        for command, args, _future in queued:
+            _ = getattr(pipe, command)(*args)
+        try:
+            results = await pipe.execute(raise_on_error=False)
+        except Exception as error:  # noqa: BLE001 - the error is delivered to every queued caller
+            for _command, _args, future in queued:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        for (_command, _args, future), result in zip(queued, results, strict=True):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def _value(self, value: str | bytes | None) -> str | bytes | None:
+        return _normalize_string(value) if self._decode_responses else value
 
     @override
-    async def get(self, key: str) -> str | None:
+    async def get(self, key: str) -> str | bytes | None:
         """Return raw value for key, or None when key does not exist."""
-        return _normalize_string(await self._client.get(key))
+        return self._value(await self._execute("get", key))
+
+    @override
+    async def exists(self, key: str) -> bool:
+        """Return True when key exists, using ``EXISTS`` so the value is not transferred."""
+        return bool(await self._execute("exists", key))
 
     @override
-    async def set(self, key: str, value: str) -> None:
+    async def set(self, key: str, value: str | bytes) -> None:
         """Store raw value for key."""
-        await self._client.set(key, value)
+        await self._execute("set", key, value)
+
+    @override
+    async def set_if_absent(self, key: str, value: str | bytes) -> bool:
+        """Store value for key with ``SET NX``, returning True when it was stored."""
+        return bool(await self._client.set(key, value, nx=True))
 
     @override
     async def delete(self, key: str) -> None:
         """Delete key if present."""
-        await self._client.delete(key)
+        await self._execute(self._delete_command, key)
 
     @override
-    async def list_keys(self, prefix: str) -> list[str]:
-        """List all keys beginning with prefix in sorted order."""
-        keys: list[str] = []
-        async for key in self._client.scan_iter(match=f"{prefix}*"):
+    async def get_many(self, keys: list[str]) -> list[str | bytes | None]:
+        """Return raw values for keys in order using a single ``MGET``."""
+        if not keys:
+            return []
+        return [self._value(value) for value in await self._client.mget(keys)]
+
+    @override
+    async def set_many(self, items: list[tuple[str, str | bytes]]) -> None:
+        """Store several raw key/value pairs using a single ``MSET``."""
+        if not items:
+            return
+        await self._client.mset(dict(items))
+
+    @override
+    async def delete_many(self, keys: list[str]) -> None:
+        """Delete several keys using a single variadic ``UNLINK`` (or ``DEL``)."""
+        if not keys:
+            return
+        await getattr(self._client, self._delete_command)(*keys)
+
+    @override
+    async def iter_keys(self, prefix: str) -> AsyncIterator[str]:
+        """Yield keys beginning with prefix as ``SCAN`` returns them, without buffering or sorting."""
+        async for key in self._client.scan_iter(match=f"{_glob_escape(prefix)}*", count=self._scan_count):
             normalized = _normalize_string(key)
             if normalized is not None:
-                keys.append(normalized)
-        return sorted(keys)
+                yield normalized
+
+    @override
+    async def scan_items(self, prefix: str) -> list[tuple[str, str | bytes]]:
+        """Return ``(key, value)`` pairs under prefix, reading scanned keys with concurrent chunked ``MGET``."""
+        chunks: list[list[str]] = [[]]
+        async for key in self.iter_keys(prefix):
+            if len(chunks[-1]) == self._mget_chunk_size:
+                chunks.append([])
+            chunks[-1].append(key)
+        if not chunks[0]:
+            return []
+        results = await asyncio.gather(*(self._client.mget(chunk) for chunk in chunks))
+        return [
+            (key, normalized)
+            for chunk, values in zip(chunks, results, strict=True)
+            for key, value in zip(chunk, values, strict=True)
+            if (normalized := self._value(value)) is not None
+        ]
+
+    @override
+    async def list_keys(self, prefix: str) -> list[str]:
+        """List all keys beginning with prefix in sorted order."""
+        return sorted([key async for key in self.iter_keys(prefix)])
 
     @override
     async def close(self) -> None:
@@ -6,6 +6,8 @@ from __future__ import annotations
 class KeyMapper:
     """Map between backend KV keys and logical nested paths."""
 
+    __slots__ = ("entry_point", "prefix", "sep")
+
     def __init__(self, entry_point: str, sep: str = ":") -> None:
         super().__init__()
         if not entry_point:
@@ -36,6 +38,20 @@ class KeyMapper:
                 raise ValueError(msg)
         return self.prefix + self.sep.join(parts)
 
+    def full_key_one(self, part: str) -> str:
+        """Build a backend key from a single logical part.
+
+        Equivalent to ``full_key(part)`` without packing and joining a parts tuple; top-level keys take this
+        path on every mapping operation.
+        """
+        if not part:
+            msg = "key parts must not be empty"
+            raise ValueError(msg)
+        if self.sep in part:
+            msg = "key parts must not contain separator"
+            raise ValueError(msg)
+        return self.prefix + part
+
     def matches(self, kv_key: str) -> bool:
         """Return True when a backend key belongs to this entry point."""
         return kv_key.startswith(self.prefix)
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
 from typing import TYPE_CHECKING, Any
 
 
@@ -22,43 +21,50 @@ def _deep_merge(left: dict[str, Any], right: dict[str, Any]) -> dict[str, Any]:
     return merged
 
 
-def reconstruct_nested(items: Iterable[tuple[tuple[str, ...], Any]]) -> Any:
-    """Reconstruct a nested object from path/value pairs.
+class _TrieNode:
+    __slots__ = ("children", "has_leaf", "leaf")
 
-    Each item consists of a tuple path and a decoded Python value.
-    The empty tuple path represents the leaf value at the current root.
-    """
-    path_to_value = dict(items)
+    def __init__(self) -> None:
+        super().__init__()
+        self.children: dict[str, _TrieNode] = {}
+        self.has_leaf = False
+        self.leaf: Any = None
 
-    def build(path: tuple[str, ...]) -> Any:
-        leaf_exists = path in path_to_value
-        leaf_value = path_to_value.get(path)
 
-        grouped_children: dict[str, list[tuple[str, ...]]] = defaultdict(list)
-        for candidate_path in path_to_value:
-            if len(candidate_path) <= len(path):
-                continue
-            if candidate_path[: len(path)] != path:
-                continue
-            child_segment = candidate_path[len(path)]
-            grouped_children[child_segment].append(candidate_path)
+def _build(node: _TrieNode) -> Any:
+    if not node.children:
+        if not node.has_leaf:
+            msg = "cannot build path with no leaf and no children"
+            raise ValueError(msg)
+        return node.leaf
 
-        if not grouped_children:
-            if not leaf_exists:
-                msg = "cannot build path with no leaf and no children"
-                raise ValueError(msg)
-            return leaf_value
+    children_obj = {segment: _build(node.children[segment]) for segment in sorted(node.children)}
 
-        children_obj = {
-            child_segment: build((*path, child_segment)) for child_segment in sorted(grouped_children.keys())
-        }
+    if not node.has_leaf:
+        return children_obj
 
-        if not leaf_exists:
-            return children_obj
+    if isinstance(node.leaf, dict):
+        return _deep_merge(node.leaf, children_obj)
 
-        if isinstance(leaf_value, dict):
-            return _deep_merge(leaf_value, children_obj)
+    return {"_value": node.leaf, **children_obj}
 
-        return {"_value": leaf_value, **children_obj}
 
-    return build(())
+def reconstruct_nested(items: Iterable[tuple[tuple[str, ...], Any]]) -> Any:
+    """Reconstruct a nested object from path/value pairs.
+
+    Each item consists of a tuple path and a decoded Python value.
+    The empty tuple path represents the leaf value at the current root.
+    Paths are inserted into a trie in one pass, so reconstruction is linear in the total path length.
+    """
+    root = _TrieNode()
+    for path, value in items:
+        node = root
+        for segment in path:
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = _TrieNode()
+            node = child
+        node.has_leaf = True
+        node.leaf = value
+
+    return _build(root)
@@ -5,71 +5,129 @@ from __future__ import annotations
 import asyncio
 import json
 import threading
+import time
+from collections import OrderedDict
 from collections.abc import Callable, Iterator, MutableMapping, MutableSequence
-from typing import TYPE_CHECKING, Any, Self, TypeVar, cast, overload, override
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Self, TypeVar, overload, override
 
 from kv_dict.key_mapping import KeyMapper, reconstruct_nested
 
 
 if TYPE_CHECKING:
-    from collections.abc import Coroutine
+    from collections.abc import Coroutine, Generator, Iterable
     from concurrent.futures import Future
 
     from kv_dict.backends import Backend
 
 
 _T = TypeVar("_T")
+_MISSING: Any = object()
+
+
+_SCALAR_TYPES: frozenset[type] = frozenset({str, int, float, bool, type(None)})
+
+
+def _to_plain(value: Any, memo: dict[int, Any] | None = None) -> Any:
+    # Dispatch on the exact type first: JSON-shaped trees are almost entirely built from these, and a set
+    # lookup is much cheaper than walking the isinstance chain in ``_to_plain_other`` for every leaf.
+    value_type = type(value)
+    if value_type in _SCALAR_TYPES:
+        return value
+    if memo is None:
+        if value_type is dict:
+            return {k: v if type(v) in _SCALAR_TYPES else _to_plain(v) for k, v in value.items()}
+        if value_type is list:
+            return [item if type(item) in _SCALAR_TYPES else _to_plain(item) for item in value]
+        return _to_plain_other(value, None)
+    # With a memo, a container referenced from several places is copied once and the copy is shared, as
+    # ``copy.deepcopy`` does. Callers only pass one for values that are encoded and dropped, never for data a
+    # write-through wrapper keeps, where shared copies would let one mutation show up under two paths.
+    result = memo.get(id(value), _MISSING)
+    if result is not _MISSING:
+        return result
+    if value_type is dict:
+        result = {k: v if type(v) in _SCALAR_TYPES else _to_plain(v, memo) for k, v in value.items()}
+    elif value_type is list:
+        result = [item if type(item) in _SCALAR_TYPES else _to_plain(item, memo) for item in value]
+    else:
+        result = _to_plain_other(value, memo)
+    memo[id(value)] = result
+    return result
 
 
-def _to_plain(value: Any) -> Any:
+def _to_plain_other(value: Any, memo: dict[int, Any] | None) -> Any:
     if isinstance(value, _WriteThroughDict):
-        return value.to_plain_dict()
+        return value.to_plain_dict(memo)
     if isinstance(value, _WriteThroughList):
-        return value.to_plain_list()
+        return value.to_plain_list(memo)
     if isinstance(value, dict):
-        return {k: _to_plain(v) for k, v in value.items()}
+        return {k: _to_plain(v, memo) for k, v in value.items()}
     if isinstance(value, list):
-        return [_to_plain(item) for item in value]
+        return [_to_plain(item, memo) for item in value]
     if isinstance(value, tuple):
-        return tuple(_to_plain(item) for item in value)
+        return tuple(_to_plain(item, memo) for item in value)
     return value
 
 
-def _wrap_write_through(value: Any, on_change: Callable[[Any], None]) -> Any:
+def _is_branch(value: Any, sep: str) -> bool:
+    # Empty dicts and dicts with keys that cannot be path segments are kept whole as a leaf at their own path.
+    return type(value) is dict and bool(value) and all(type(key) is str and key and sep not in key for key in value)
+
+
+def _flatten(parts: tuple[str, ...], value: Any, sep: str) -> Iterator[tuple[tuple[str, ...], Any]]:
+    if _is_branch(value, sep):
+        for key, child in value.items():
+            yield from _flatten((*parts, key), child, sep)
+    else:
+        yield parts, value
+
+
+async def _gather[T](coroutines: list[Coroutine[Any, Any, T]]) -> list[T]:
+    return list(await asyncio.gather(*coroutines))
+
+
+def _wrap_write_through(value: Any, on_change: Callable[[tuple[str, ...]], None]) -> Any:
     if isinstance(value, dict):
-        return _WriteThroughDict(value, cast("Callable[[dict[str, Any]], None]", on_change))
+        return _WriteThroughDict(value, on_change)
     if isinstance(value, list):
-        return _WriteThroughList(value, cast("Callable[[list[Any]], None]", on_change))
+        return _WriteThroughList(value, on_change)
     return value
 
 
 class _WriteThroughDict(MutableMapping[str, Any]):
-    """Dict-like wrapper that persists parent mapping on mutation."""
+    """Dict-like wrapper that persists parent mapping on mutation.
+
+    ``_data`` only ever holds plain values (every assignment goes through ``_to_plain``), so it is shared
+    with the parent value instead of being copied. ``on_change`` receives the path, relative to this dict,
+    of the part that changed: ``(key,)`` for a single-key assignment or deletion, ``()`` for the whole dict.
+    """
+
+    __slots__ = ("_data", "_on_change")
 
-    def __init__(self, data: dict[str, Any], on_change: Callable[[dict[str, Any]], None]) -> None:
+    def __init__(self, data: dict[str, Any], on_change: Callable[[tuple[str, ...]], None]) -> None:
         super().__init__()
         self._data = data
         self._on_change = on_change
 
-    def _persist(self) -> None:
-        self._on_change(self.to_plain_dict())
-
-    def _wrap_if_needed(self, value: Any) -> Any:
-        return _wrap_write_through(value, lambda _updated: self._persist())
+    def _wrap_if_needed(self, key: str, value: Any) -> Any:
+        return _wrap_write_through(value, lambda path: self._on_change((key, *path)))
 
     @override
     def __getitem__(self, key: str) -> Any:
-        return self._wrap_if_needed(self._data[key])
+        return self._wrap_if_needed(key, self._data[key])
 
     @override
     def __setitem__(self, key: str, value: Any) -> None:
+        # Filling an empty dict changes how the dict itself is stored, so that is reported as a whole change.
+        path = (key,) if self._data else ()
         self._data[key] = _to_plain(value)
-        self._persist()
+        self._on_change(path)
 
     @override
     def __delitem__(self, key: str) -> None:
         del self._data[key]
-        self._persist()
+        self._on_change((key,) if self._data else ())
 
     @override
     def __iter__(self) -> Iterator[str]:
@@ -84,10 +142,14 @@ class _WriteThroughDict(MutableMapping[str, Any]):
         updates = dict(*args, **kwargs)
         for key, value in updates.items():
             self._data[key] = _to_plain(value)
-        self._persist()
+        self._on_change(())
 
-    def to_plain_dict(self) -> dict[str, Any]:
-        return {key: _to_plain(value) for key, value in self._data.items()}
+    def to_plain_dict(self, memo: dict[int, Any] | None = None) -> dict[str, Any]:
+        return _to_plain(self._data, memo)
+
+    def detach(self) -> dict[str, Any]:
+        """Return the wrapped plain data itself, for callers holding the only reference to it."""
+        return self._data
 
     @override
     def __repr__(self) -> str:
@@ -95,24 +157,35 @@ class _WriteThroughDict(MutableMapping[str, Any]):
 
     @override
     def __eq__(self, other: object) -> bool:
-        return self.to_plain_dict() == _to_plain(other)
+        # ``_data`` is already plain, and plain containers compare equal to nested wrappers through the wrappers'
+        # own ``__eq__``, so neither side needs a plain copy.
+        if isinstance(other, _WriteThroughDict):
+            return self._data == other._data
+        return self._data == other
 
     __hash__: None = None  # type: ignore[assignment]  # pyright: ignore[reportIncompatibleVariableOverride]
 
 
 class _WriteThroughList(MutableSequence[Any]):
-    """List-like wrapper that persists parent mapping on mutation."""
+    """List-like wrapper that persists parent mapping on mutation.
+
+    Like ``_WriteThroughDict``, ``_data`` is kept plain and shared without a copy. Lists are stored whole, so
+    every change, including one inside a nested item, is reported to ``on_change`` as the empty path.
+    """
 
-    def __init__(self, data: list[Any], on_change: Callable[[list[Any]], None]) -> None:
+    __slots__ = ("_data", "_on_change")
+
+    def __init__(self, data: list[Any], on_change: Callable[[tuple[str, ...]], None]) -> None:
         super().__init__()
         self._data = data
         self._on_change = on_change
 
-    def _persist(self) -> None:
-        self._on_change(self.to_plain_list())
+    def _persist(self, _path: tuple[str, ...] = ()) -> None:
+        # Also the ``on_change`` of wrapped items: whatever path an item reports, the list is rewritten whole.
+        self._on_change(())
 
     def _wrap_if_needed(self, value: Any) -> Any:
-        return _wrap_write_through(value, lambda _updated: self._persist())
+        return _wrap_write_through(value, self._persist)
 
     @overload
     def __getitem__(self, index: int) -> Any:
@@ -156,8 +229,12 @@ class _WriteThroughList(MutableSequence[Any]):
         self._data.insert(index, _to_plain(value))
         self._persist()
 
-    def to_plain_list(self) -> list[Any]:
-        return [_to_plain(item) for item in self._data]
+    def to_plain_list(self, memo: dict[int, Any] | None = None) -> list[Any]:
+        return _to_plain(self._data, memo)
+
+    def detach(self) -> list[Any]:
+        """Return the wrapped plain data itself, for callers holding the only reference to it."""
+        return self._data
 
     @override
     def __repr__(self) -> str:
@@ -165,7 +242,9 @@ class _WriteThroughList(MutableSequence[Any]):
 
     @override
     def __eq__(self, other: object) -> bool:
-        return self.to_plain_list() == _to_plain(other)
+        if isinstance(other, _WriteThroughList):
+            return self._data == other._data
+        return self._data == other
 
     __hash__: None = None  # type: ignore[assignment]  # pyright: ignore[reportIncompatibleVariableOverride]
 
@@ -173,6 +252,8 @@ class _WriteThroughList(MutableSequence[Any]):
 class _AsyncLoopBridge:
     """Bridge sync calls to async backend operations on a dedicated loop."""
 
+    __slots__ = ("_loop", "_loop_ready", "_thread")
+
     def __init__(self) -> None:
         super().__init__()
         self._loop_ready = threading.Event()
@@ -189,12 +270,20 @@ class _AsyncLoopBridge:
         loop.run_forever()
 
     def run(self, coroutine: Coroutine[Any, Any, _T]) -> _T:
-        if self._loop is None:
+        loop = self._loop
+        if loop is None:
             msg = "remote mapping async loop not initialized"
             raise RuntimeError(msg)
-        future: Future[Any] = asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+        future: Future[Any] = asyncio.run_coroutine_threadsafe(coroutine, loop)
         return future.result()
 
+    def run_many(self, coroutines: Iterable[Coroutine[Any, Any, _T]]) -> list[_T]:
+        """Run several coroutines concurrently with a single submission and a single blocking wait."""
+        pending = list(coroutines)
+        if not pending:
+            return []
+        return self.run(_gather(pending))
+
     def close(self) -> None:
         if self._loop is None:
             return
@@ -202,92 +291,687 @@ class _AsyncLoopBridge:
         self._thread.join(timeout=5)
 
 
+class _SharedBridge:
+    """Process-wide ``_AsyncLoopBridge`` shared by all mappings and stopped when the last one releases it."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._lock = threading.Lock()
+        self._bridge: _AsyncLoopBridge | None = None
+        self._refs = 0
+
+    def acquire(self) -> _AsyncLoopBridge:
+        """Return the shared bridge, starting its loop thread on first use."""
+        with self._lock:
+            if self._bridge is None:
+                self._bridge = _AsyncLoopBridge()
+            self._refs += 1
+            return self._bridge
+
+    def release(self) -> None:
+        """Drop one reference, stopping the loop thread once no mapping uses it."""
+        with self._lock:
+            self._refs -= 1
+            if self._refs > 0 or self._bridge is None:
+                return
+            bridge, self._bridge = self._bridge, None
+        bridge.close()
+
+
+_SHARED_BRIDGE = _SharedBridge()
+
+
+class _LocalCache:
+    """Bounded LRU cache of decoded values, plus the set of top-level keys, with an optional time-to-live.
+
+    Every invalidation bumps a generation counter. Readers take ``generation()`` before fetching and pass it
+    to ``put``, which drops the value when an invalidation happened in between: the fetch may then have
+    raced a write and returned the old value.
+    """
+
+    def __init__(self, max_size: int, ttl: float | None) -> None:
+        super().__init__()
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: OrderedDict[str, tuple[Any, float | None]] = OrderedDict()
+        self._keys: tuple[tuple[str, ...], float | None] | None = None
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Return True when the cache can hold entries."""
+        return self._max_size > 0
+
+    def expiry(self) -> float | None:
+        """Return the monotonic deadline for an entry stored now."""
+        return None if self._ttl is None else time.monotonic() + self._ttl
+
+    def generation(self) -> int:
+        """Return the current invalidation generation."""
+        return self._generation
+
+    def get(self, key: str) -> Any:
+        """Return the cached value for key, or ``_MISSING`` when absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISSING
+            value, expires_at = entry
+            if expires_at is not None and time.monotonic() >= expires_at:
+                del self._entries[key]
+                return _MISSING
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: Any, generation: int) -> None:
+        """Store value for key unless invalidated since ``generation``, evicting least recently used entries."""
+        if not self.enabled:
+            return
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = (value, self.expiry())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                _ = self._entries.popitem(last=False)
+
+    def get_keys(self) -> tuple[str, ...] | None:
+        """Return the cached top-level keys in sorted order, or None when absent or expired."""
+        with self._lock:
+            if self._keys is None:
+                return None
+            keys, expires_at = self._keys
+            if expires_at is not None and time.monotonic() >= expires_at:
+                self._keys = None
+                return None
+            return keys
+
+    def put_keys(self, keys: tuple[str, ...], generation: int) -> None:
+        """Store the sorted top-level keys unless invalidated since ``generation``."""
+        if not self.enabled:
+            return
+        with self._lock:
+            if generation == self._generation:
+                self._keys = (keys, self.expiry())
+
+    def pop(self, key: str) -> None:
+        """Drop key and the cached top-level keys."""
+        with self._lock:
+            self._generation += 1
+            _ = self._entries.pop(key, None)
+            self._keys = None
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._keys = None
+
+
 class RemoteKVMapping(MutableMapping[str, Any]):
     """Dict-like sync API over a flattened async KV backend."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         backend: Backend,
         entry_point: str,
         sep: str = ":",
-        json_encoder: Callable[[Any], str] = json.dumps,
-        json_decoder: Callable[[str], Any] = json.loads,
+        json_encoder: Callable[[Any], str | bytes] = json.dumps,
+        json_decoder: Callable[[str | bytes], Any] = json.loads,
+        *,
+        prefetch: bool = False,
+        cache_size: int = 0,
+        cache_ttl: float | None = None,
+        flatten_on_write: bool = False,
     ) -> None:
+        """Create a mapping over ``backend`` rooted at ``entry_point``.
+
+        Parameters
+        ----------
+        backend
+            Async backend storing the flattened keys.
+        entry_point
+            Prefix segment shared by all keys of this mapping.
+        sep
+            Separator between key path segments.
+        json_encoder
+            Callable encoding plain values for storage. It may return ``bytes`` (e.g. ``orjson.dumps``),
+            which backends store without a ``str`` round-trip. Values other than dicts, lists and tuples
+            (such as ``array.array`` or ``numpy.ndarray`` columns) reach the encoder unchanged, so a codec such
+            as ``orjson`` with ``OPT_SERIALIZE_NUMPY`` can serialize them from their buffers directly.
+        json_decoder
+            Callable decoding stored values; it receives ``str`` or ``bytes`` depending on the backend.
+        prefetch
+            When True, load every key under ``entry_point`` once at construction and serve reads from that
+            local snapshot. Writes go through to the backend and update the snapshot. The snapshot is
+            reloaded once ``cache_ttl`` has elapsed.
+        cache_size
+            Maximum number of decoded top-level values kept in a local LRU cache. ``0`` disables caching.
+            When enabled, the set of top-level keys is cached too, and whole-mapping reads such as ``copy()``
+            are served locally while every value is cached. Local writes invalidate it, and ``refresh()`` drops
+            everything cached.
+        cache_ttl
+            Seconds after which cached values and the prefetch snapshot expire. ``None`` keeps them until
+            they are invalidated by a local write or evicted.
+        flatten_on_write
+            When True, dict values are stored as one backend key per leaf (``entry_point:key:a:b``) instead of
+            a single encoded blob, so other clients can read or update sub-paths directly. Keys left over from
+            the previous value are deleted in the same bridge round-trip, and in-place mutations of a value read
+            from the mapping rewrite only the subtree they touch. Empty dicts, and dicts whose keys are
+            not valid path segments, are stored whole, as is the default written by ``setdefault`` (its atomic
+            write covers a single key).
+        """
         super().__init__()
         self._backend = backend
         self._mapper = KeyMapper(entry_point=entry_point, sep=sep)
+        self._prefix_len = len(self._mapper.prefix)
         self._json_encoder = json_encoder
         self._json_decoder = json_decoder
-        self._bridge = _AsyncLoopBridge()
+        self._bridge = _SHARED_BRIDGE.acquire()
+        self._closed = False
+        self._pipeline = threading.local()
+        self._cache = _LocalCache(cache_size, cache_ttl)
+        self._prefetch = prefetch
+        self._snapshot: dict[str, dict[str, str | bytes]] | None = None
+        self._snapshot_expires_at: float | None = None
+        self._flatten_on_write = flatten_on_write
+        _ = self._current_snapshot()
 
     def _as_dict(self) -> dict[str, Any]:
-        return {key: self[key] for key in self}
-
-    def _relevant_backend_keys(self, top_key: str) -> list[str]:
-        base = self._mapper.full_key(top_key)
-        keys = self._bridge.run(self._backend.list_keys(base))
-        return [key for key in keys if key == base or key.startswith(f"{base}{self._mapper.sep}")]
-
-    @override
-    def __getitem__(self, key: str) -> Any:
-        """Return nested object reconstructed from matching backend keys."""
-        backend_keys = self._relevant_backend_keys(key)
-        if not backend_keys:
-            raise KeyError(key)
+        # One prefix scan buckets every key by its top-level segment; reading key by key would scan the backend
+        # once per top-level key on top of the listing.
+        self._flush_pending()
+        entries = self._cached_entries()
+        if entries is not None:
+            return {key: self._wrap_cached(key, entry) for key, entry in entries.items()}
+        generation = self._cache.generation()
+        snapshot = self._current_snapshot()
+        if snapshot is None:
+            snapshot = self._bridge.run(self._fetch_snapshot())
+        result = {
+            key: self._build_value(key, self._snapshot_pairs(key, snapshot), generation)
+            for key in sorted(snapshot)
+            if key
+        }
+        self._cache.put_keys(tuple(result), generation)
+        return result
 
-        root_key = self._mapper.full_key(key)
-        pairs: list[tuple[tuple[str, ...], Any]] = []
-        for backend_key in backend_keys:
-            raw_value = self._bridge.run(self._backend.get(backend_key))
-            if raw_value is None:
+    def _cached_entries(self) -> dict[str, tuple[Any, frozenset[str] | None]] | None:
+        # With every top-level key and value cached and nothing written since, the whole mapping is served
+        # locally; a single missing or expired entry means a fresh scan.
+        keys = self._cache.get_keys()
+        if keys is None:
+            return None
+        entries: dict[str, tuple[Any, frozenset[str] | None]] = {}
+        for key in keys:
+            entry = self._cached_value(key)
+            if entry is _MISSING:
+                return None
+            entries[key] = entry
+        return entries
+
+    def _pending_writes(self) -> dict[str, Any] | None:
+        return getattr(self._pipeline, "writes", None)
+
+    def _flush_pending(self) -> None:
+        pending = self._pending_writes()
+        if not pending:
+            return
+        writes = list(pending.items())
+        pending.clear()
+        self._store(writes)
+
+    def _write_plain(self, items: list[tuple[str, Any]]) -> None:
+        plain_items = [(self._mapper.full_key_one(key), value) for key, value in items]
+        for backend_key, _value in plain_items:
+            self._invalidate(backend_key)
+        pending = self._pending_writes()
+        if pending is not None:
+            pending.update(plain_items)
+            return
+        self._store(plain_items)
+
+    def _store(self, plain_items: list[tuple[str, Any]]) -> None:
+        if self._flatten_on_write:
+            self._replace_subtrees(dict(plain_items))
+        else:
+            self._persist_items([(backend_key, self._json_encoder(value)) for backend_key, value in plain_items])
+
+    def _leaves(self, base: str, value: Any) -> list[tuple[str, str | bytes]]:
+        # Encoded ``(backend_key, leaf)`` pairs storing ``value`` at ``base``; ``_MISSING`` stores nothing.
+        if value is _MISSING:
+            return []
+        sep, encode = self._mapper.sep, self._json_encoder
+        return [
+            (f"{base}{sep}{sep.join(parts)}" if parts else base, encode(leaf))
+            for parts, leaf in _flatten((), value, sep)
+        ]
+
+    def _write_path(self, key: str, root: Any, layout: set[str] | None, path: tuple[str, ...]) -> None:
+        # ``layout`` holds the backend keys the value is stored under, so a flattened value only rewrites the
+        # subtree at ``path`` and its stale keys are known without listing the backend.
+        if layout is None or self._pending_writes() is not None:
+            self._write_plain([(key, root)])
+            if layout is not None:
+                layout.clear()
+                layout.update(backend_key for backend_key, _leaf in self._leaves(self._mapper.full_key_one(key), root))
+            return
+        sep = self._mapper.sep
+        node, base = root, self._mapper.full_key_one(key)
+        for segment in path:
+            # Stop at a node stored whole (its key is in ``layout``) or one that cannot be flattened (any more).
+            if base in layout or not _is_branch(node, sep) or not segment or sep in segment:
+                break
+            node = node.get(segment, _MISSING)
+            base = f"{base}{sep}{segment}"
+        leaves = self._leaves(base, node)
+        written = {backend_key for backend_key, _leaf in leaves}
+        child_prefix = f"{base}{sep}"
+        stale = sorted(
+            backend_key
+            for backend_key in layout
+            if (backend_key == base or backend_key.startswith(child_prefix)) and backend_key not in written
+        )
+        self._invalidate(base)
+        try:
+            self._bridge.run(self._apply_writes(stale, leaves))
+        finally:
+            # Drop anything a concurrent reader cached from before the write landed.
+            self._invalidate(base)
+        layout.difference_update(stale)
+        layout.update(written)
+        if self._snapshot is not None:
+            entries = self._snapshot.setdefault(key, {})
+            for backend_key in stale:
+                _ = entries.pop(backend_key, None)
+            entries.update(leaves)
+
+    def _replace_subtrees(self, values: dict[str, Any]) -> None:
+        # ``values`` maps backend keys to plain values; ``_MISSING`` deletes the key and everything below it.
+        sep = self._mapper.sep
+        trees: dict[str, list[tuple[str, str | bytes]]] = {}
+        for base, value in values.items():
+            self._invalidate(base)
+            trees[base] = self._leaves(base, value)
+        snapshot = self._snapshot
+        known_keys = (
+            {
+                base: [
+                    backend_key
+                    for backend_key in snapshot.get(self._top_key(base), {})
+                    if backend_key == base or backend_key.startswith(f"{base}{sep}")
+                ]
+                for base in trees
+            }
+            if snapshot is not None
+            else {}
+        )
+        try:
+            self._bridge.run(self._write_trees(trees, known_keys))
+        finally:
+            for base in trees:
+                self._invalidate(base)
+        if snapshot is not None:
+            for base, leaves in trees.items():
+                entries = snapshot.setdefault(self._top_key(base), {})
+                for backend_key in known_keys[base]:
+                    del entries[backend_key]
+                entries.update(leaves)
+
+    def _persist_items(self, items: list[tuple[str, str | bytes]]) -> None:
+        for backend_key, _encoded_value in items:
+            self._invalidate(backend_key)
+        try:
+            if len(items) == 1:
+                backend_key, encoded_value = items[0]
+                self._bridge.run(self._backend.set(backend_key, encoded_value))
+            else:
+                self._bridge.run(self._backend.set_many(items))
+        finally:
+            # Drop anything a concurrent reader cached from before the write landed.
+            for backend_key, _encoded_value in items:
+                self._invalidate(backend_key)
+        if self._snapshot is not None:
+            for backend_key, encoded_value in items:
+                self._snapshot.setdefault(self._top_key(backend_key), {})[backend_key] = encoded_value
+
+    def _top_key(self, backend_key: str) -> str:
+        # Backend keys here were built by the mapper, so slice off the prefix instead of re-validating them.
+        return backend_key[self._prefix_len :].split(self._mapper.sep, 1)[0]
+
+    def _invalidate(self, backend_key: str) -> None:
+        self._cache.pop(self._mapper.prefix + self._top_key(backend_key))
+
+    def _current_snapshot(self) -> dict[str, dict[str, str | bytes]] | None:
+        if not self._prefetch:
+            return None
+        expires_at = self._snapshot_expires_at
+        if self._snapshot is None or (expires_at is not None and time.monotonic() >= expires_at):
+            self._snapshot = self._bridge.run(self._fetch_snapshot())
+            self._snapshot_expires_at = self._cache.expiry()
+        return self._snapshot
+
+    async def _fetch_snapshot(self) -> dict[str, dict[str, str | bytes]]:
+        snapshot: dict[str, dict[str, str | bytes]] = {}
+        prefix, prefix_len, sep = self._mapper.prefix, self._prefix_len, self._mapper.sep
+        for key, value in await self._backend.scan_items(prefix):
+            if not key.startswith(prefix):
                 continue
-            decoded_value = self._json_decoder(raw_value)
-            remainder = backend_key.removeprefix(root_key).removeprefix(self._mapper.sep)
-            path = tuple(remainder.split(self._mapper.sep)) if remainder else ()
-            pairs.append((path, decoded_value))
+            snapshot.setdefault(key[prefix_len:].split(sep, 1)[0], {})[key] = value
+        return snapshot
+
+    async def _child_keys(self, base: str) -> list[str]:
+        # Order does not matter to callers, so stream the unsorted keys instead of paying for list_keys' sort.
+        # Keys are re-checked because a backend may match pattern characters in the prefix loosely.
+        prefix = f"{base}{self._mapper.sep}"
+        return [key async for key in self._backend.iter_keys(prefix) if key.startswith(prefix)]
+
+    async def _keys_under(self, base: str) -> list[str]:
+        # Scanning ``base + sep`` never touches siblings such as ``basefoo``; the exact key is probed alongside
+        # with ``exists`` so no value is transferred.
+        children, exact = await asyncio.gather(self._child_keys(base), self._backend.exists(base))
+        return [base, *children] if exact else children
+
+    async def _contains_many(self, keys: list[str]) -> list[bool]:
+        bases = [self._mapper.full_key_one(key) for key in keys]
+        exact, children = await asyncio.gather(
+            self._backend.exists_many(bases), _gather([self._child_keys(base) for base in bases])
+        )
+        return [found or bool(child_keys) for found, child_keys in zip(exact, children, strict=True)]
+
+    async def _relevant_backend_keys(self, top_key: str) -> list[str]:
+        return await self._keys_under(self._mapper.full_key_one(top_key))
+
+    async def _delete_tree(self, key: str, known_keys: list[str]) -> bool:
+        # Listing and deleting run in one coroutine so a delete costs a single bridge round-trip.
+        backend_keys = sorted({*await self._relevant_backend_keys(key), *known_keys})
+        if not backend_keys:
+            return False
+        await self._backend.delete_many(backend_keys)
+        return True
 
+    async def _write_trees(
+        self, trees: dict[str, list[tuple[str, str | bytes]]], known_keys: dict[str, list[str]]
+    ) -> None:
+        # Listing the old keys, deleting the stale ones and writing the new leaves cost one bridge round-trip.
+        bases = list(trees)
+        listed = await _gather([self._keys_under(base) for base in bases])
+        writes = [item for leaves in trees.values() for item in leaves]
+        written = {backend_key for backend_key, _encoded_value in writes}
+        stale = {
+            backend_key
+            for base, backend_keys in zip(bases, listed, strict=True)
+            for backend_key in (*backend_keys, *known_keys.get(base, ()))
+            if backend_key not in written
+        }
+        if stale:
+            await self._backend.delete_many(sorted(stale))
+        if writes:
+            await self._backend.set_many(writes)
+
+    async def _apply_writes(self, stale: list[str], writes: list[tuple[str, str | bytes]]) -> None:
+        # ``stale`` and ``writes`` never share a key, so the delete and the write are sent concurrently.
+        operations: list[Coroutine[Any, Any, None]] = []
+        if len(stale) == 1:
+            operations.append(self._backend.delete(stale[0]))
+        elif stale:
+            operations.append(self._backend.delete_many(stale))
+        if len(writes) == 1:
+            operations.append(self._backend.set(*writes[0]))
+        elif writes:
+            operations.append(self._backend.set_many(writes))
+        _ = await asyncio.gather(*operations)
+
+    async def _set_default(self, key: str, encoded_value: str | bytes) -> list[tuple[tuple[str, ...], Any]] | None:
+        # Returns None when ``encoded_value`` was stored, otherwise the pairs of the existing value.
+        pairs = await self._fetch_pairs(key)
+        if pairs:
+            return pairs
+        if await self._backend.set_if_absent(self._mapper.full_key_one(key), encoded_value):
+            return None
+        return await self._fetch_pairs(key)
+
+    async def _fetch_pairs(self, key: str) -> list[tuple[tuple[str, ...], Any]]:
+        base = self._mapper.full_key_one(key)
+        prefix = f"{base}{self._mapper.sep}"
+        scanned, exact = await asyncio.gather(self._backend.scan_items(prefix), self._backend.get(base))
+        children = [item for item in scanned if item[0].startswith(prefix)]
+        return self._decode_pairs(key, children if exact is None else [(base, exact), *children])
+
+    def _snapshot_pairs(
+        self, key: str, snapshot: dict[str, dict[str, str | bytes]]
+    ) -> list[tuple[tuple[str, ...], Any]]:
+        return self._decode_pairs(key, snapshot.get(key, {}).items())
+
+    def _decode_pairs(self, key: str, items: Iterable[tuple[str, str | bytes]]) -> list[tuple[tuple[str, ...], Any]]:
+        root_key = self._mapper.full_key_one(key)
+        sep = self._mapper.sep
+        child_start = len(root_key) + len(sep)
+        decode = self._json_decoder
+        return [
+            (() if backend_key == root_key else tuple(backend_key[child_start:].split(sep)), decode(raw_value))
+            for backend_key, raw_value in items
+        ]
+
+    def _build_value(self, key: str, pairs: list[tuple[tuple[str, ...], Any]], generation: int) -> Any:
         if not pairs:
             raise KeyError(key)
-
         result = reconstruct_nested(pairs)
-        return _wrap_write_through(result, lambda updated: self.__setitem__(key, updated))
+        layout = self._layout(key, pairs)
+        if not self._cache.enabled:
+            return self._wrap_value(key, result, layout)
+        entry = (result, None if layout is None else frozenset(layout))
+        self._cache.put(self._mapper.full_key_one(key), entry, generation)
+        return self._wrap_cached(key, entry)
+
+    def _layout(self, key: str, pairs: list[tuple[tuple[str, ...], Any]]) -> set[str] | None:
+        # Only flattened writes need to know which backend keys a value was read from.
+        if not self._flatten_on_write:
+            return None
+        base, sep = self._mapper.full_key_one(key), self._mapper.sep
+        return {f"{base}{sep}{sep.join(path)}" if path else base for path, _value in pairs}
+
+    def _wrap_value(self, key: str, value: Any, layout: set[str] | None) -> Any:
+        return _wrap_write_through(value, lambda path: self._write_path(key, value, layout, path))
+
+    def _wrap_cached(self, key: str, entry: tuple[Any, frozenset[str] | None]) -> Any:
+        # Hand out a private copy so in-place mutations never reach the cache before they are persisted.
+        value, layout = entry
+        return self._wrap_value(key, _to_plain(value), None if layout is None else set(layout))
+
+    def _cached_value(self, key: str) -> Any:
+        return self._cache.get(self._mapper.full_key_one(key))
+
+    @override
+    def __getitem__(self, key: str) -> Any:
+        """Return nested object reconstructed from matching backend keys."""
+        self._flush_pending()
+        cached = self._cached_value(key)
+        if cached is not _MISSING:
+            return self._wrap_cached(key, cached)
+        generation = self._cache.generation()
+        snapshot = self._current_snapshot()
+        if snapshot is not None:
+            return self._build_value(key, self._snapshot_pairs(key, snapshot), generation)
+        return self._build_value(key, self._bridge.run(self._fetch_pairs(key)), generation)
 
     @override
     def __setitem__(self, key: str, value: Any) -> None:
         """Store a top-level value at entry_point:key."""
-        backend_key = self._mapper.full_key(key)
-        encoded_value = self._json_encoder(_to_plain(value))
-        self._bridge.run(self._backend.set(backend_key, encoded_value))
+        self._write_plain([(key, _to_plain(value, {}))])
 
     @override
     def __delitem__(self, key: str) -> None:
         """Delete a top-level key and all nested descendants."""
-        backend_keys = self._relevant_backend_keys(key)
-        if not backend_keys:
+        self._flush_pending()
+        known_keys = list(self._snapshot.get(key, {})) if self._snapshot is not None else []
+        backend_key = self._mapper.full_key_one(key)
+        self._invalidate(backend_key)
+        try:
+            deleted = self._bridge.run(self._delete_tree(key, known_keys))
+        finally:
+            self._invalidate(backend_key)
+        if not deleted:
             raise KeyError(key)
-        for backend_key in backend_keys:
-            self._bridge.run(self._backend.delete(backend_key))
+        if self._snapshot is not None:
+            _ = self._snapshot.pop(key, None)
+
+    @override
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        """Return the value for key, first storing ``default`` when key does not exist.
+
+        The existence check and the conditional write share one bridge round-trip, and the write uses the
+        backend's atomic ``set_if_absent``.
+        """
+        self._flush_pending()
+        cached = self._cached_value(key)
+        if cached is not _MISSING:
+            return self._wrap_cached(key, cached)
+        generation = self._cache.generation()
+        snapshot = self._current_snapshot()
+        if snapshot is not None and snapshot.get(key):
+            return self._build_value(key, self._snapshot_pairs(key, snapshot), generation)
+
+        plain_default = _to_plain(default)
+        backend_key = self._mapper.full_key_one(key)
+        self._invalidate(backend_key)
+        generation = self._cache.generation()
+        encoded_value = self._json_encoder(plain_default)
+        try:
+            existing = self._bridge.run(self._set_default(key, encoded_value))
+        except BaseException:
+            self._invalidate(backend_key)
+            raise
+        if existing is not None:
+            return self._build_value(key, existing, generation)
+        self._invalidate(backend_key)
+        if self._snapshot is not None:
+            self._snapshot.setdefault(key, {})[backend_key] = encoded_value
+        return self._wrap_value(key, plain_default, {backend_key} if self._flatten_on_write else None)
+
+    def get_many(self, keys: Iterable[str]) -> list[Any]:
+        """Return values for several top-level keys in a single bridge round-trip.
+
+        Raises ``KeyError`` for the first key that does not exist.
+        """
+        self._flush_pending()
+        requested = list(keys)
+        cached = {key: value for key in requested if (value := self._cached_value(key)) is not _MISSING}
+        missing = [key for key in requested if key not in cached]
+        generation = self._cache.generation()
+        snapshot = self._current_snapshot()
+        if snapshot is not None:
+            fetched = [self._snapshot_pairs(key, snapshot) for key in missing]
+        else:
+            fetched = self._bridge.run_many(self._fetch_pairs(key) for key in missing)
+        built = {key: self._build_value(key, pairs, generation) for key, pairs in zip(missing, fetched, strict=True)}
+        return [self._wrap_cached(key, cached[key]) if key in cached else built[key] for key in requested]
+
+    def set_many(self, items: Iterable[tuple[str, Any]]) -> None:
+        """Store several top-level values in a single bridge round-trip."""
+        memo: dict[int, Any] = {}
+        self._write_plain([(key, _to_plain(value, memo)) for key, value in items])
+
+    @override
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        """Update from a mapping or iterable of pairs, batching all writes."""
+        self.set_many(dict(*args, **kwargs).items())
+
+    @contextmanager
+    def autopipeline(self) -> Generator[Self]:
+        """Buffer top-level writes issued from this thread and flush them on exit.
+
+        Repeated writes to the same key are coalesced so only the latest value is encoded and sent.
+        Reads issued inside the block flush the buffer first, so they always observe earlier writes.
+        """
+        if self._pending_writes() is not None:
+            yield self
+            return
+
+        self._pipeline.writes = {}
+        try:
+            yield self
+        finally:
+            try:
+                self._flush_pending()
+            finally:
+                self._pipeline.writes = None
+
+    def _top_level_keys(self) -> tuple[str, ...]:
+        # Returned sorted; the cached tuple is kept in that order so repeated iteration does not sort again.
+        self._flush_pending()
+        snapshot = self._current_snapshot()
+        if snapshot is not None:
+            return tuple(sorted(snapshot))
+        cached = self._cache.get_keys()
+        if cached is not None:
+            return cached
+        generation = self._cache.generation()
+        listed = self._bridge.run(self._backend.list_top_level(self._mapper.prefix, self._mapper.sep))
+        keys = tuple(sorted(set(listed)))
+        self._cache.put_keys(keys, generation)
+        return keys
+
+    @override
+    def __contains__(self, key: object) -> bool:
+        """Return True when key exists, checking backend keys only without decoding values."""
+        if not isinstance(key, str):
+            return False
+        self._flush_pending()
+        if self._cached_value(key) is not _MISSING:
+            return True
+        snapshot = self._current_snapshot()
+        if snapshot is not None:
+            return bool(snapshot.get(key))
+        return bool(self._bridge.run(self._relevant_backend_keys(key)))
+
+    def contains_many(self, keys: Iterable[str]) -> list[bool]:
+        """Return membership for several top-level keys in a single bridge round-trip."""
+        self._flush_pending()
+        requested = list(keys)
+        snapshot = self._current_snapshot()
+        if snapshot is not None:
+            return [bool(snapshot.get(key)) for key in requested]
+        found = {key for key in requested if self._cached_value(key) is not _MISSING}
+        unknown = list(dict.fromkeys(key for key in requested if key not in found))
+        listed = self._bridge.run(self._contains_many(unknown)) if unknown else []
+        found.update(key for key, exists in zip(unknown, listed, strict=True) if exists)
+        return [key in found for key in requested]
 
     @override
     def __iter__(self) -> Iterator[str]:
         """Iterate sorted top-level keys under the configured entry point."""
-        keys = self._bridge.run(self._backend.list_keys(self._mapper.prefix))
-        top_level_keys: set[str] = set()
-        for backend_key in keys:
-            if not self._mapper.matches(backend_key):
-                continue
-            parts = self._mapper.relative_parts(backend_key)
-            top_level_keys.add(parts[0])
-        return iter(sorted(top_level_keys))
+        return iter(self._top_level_keys())
 
     @override
     def __len__(self) -> int:
-        """Return count of top-level keys."""
-        return len(list(iter(self)))
+        """Return count of top-level keys, counted by the backend unless they are already known locally."""
+        self._flush_pending()
+        snapshot = self._current_snapshot()
+        if snapshot is not None:
+            return len(snapshot)
+        cached = self._cache.get_keys()
+        if cached is not None:
+            return len(cached)
+        return self._bridge.run(self._backend.count_top_level(self._mapper.prefix, self._mapper.sep))
+
+    def refresh(self) -> None:
+        """Drop locally cached values and keys and the prefetch snapshot so the next access re-reads the backend."""
+        self._flush_pending()
+        self._cache.clear()
+        if self._prefetch:
+            self._snapshot = None
 
     def copy(self) -> dict[str, Any]:
         """Return a detached plain-dict snapshot of current mapping contents."""
-        return _to_plain(self._as_dict())
+        # Each wrapper from ``_as_dict`` holds a freshly decoded or privately copied plain tree that nothing else
+        # references, so unwrapping it detaches the value without walking it again.
+        return {
+            key: value.detach() if isinstance(value, (_WriteThroughDict, _WriteThroughList)) else value
+            for key, value in self._as_dict().items()
+        }
 
     def __ior__(self, other: Any) -> Self:
         """Implement in-place union update semantics (``|=``)."""
@@ -311,6 +995,22 @@ class RemoteKVMapping(MutableMapping[str, Any]):
         return str(self._as_dict())
 
     def close(self) -> None:
-        """Close backend and bridge resources."""
-        self._bridge.run(self._backend.close())
-        self._bridge.close()
+        """Close the backend and release this mapping's hold on the shared bridge.
+
+        Calling ``close`` more than once is a no-op.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._bridge.run(self._backend.close())
+        finally:
+            _SHARED_BRIDGE.release()
+
+    def __enter__(self) -> Self:
+        """Return the mapping for use in a ``with`` block that closes it on exit."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the mapping when leaving a ``with`` block."""
+        self.close()
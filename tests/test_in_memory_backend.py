@@ -10,6 +10,13 @@ async def test_get_set_roundtrip() -> None:
     assert await backend.get("ep1:user:alice") == '{"age": 30}'
 
 
+@pytest.mark.asyncio
+async def test_bytes_values_are_stored_as_given() -> None:
+    backend = InMemoryAsyncBackend()
+    await backend.set("ep1:user:alice", b'{"age": 30}')
+    assert await backend.get("ep1:user:alice") == b'{"age": 30}'
+
+
 @pytest.mark.asyncio
 async def test_get_missing_returns_none() -> None:
     backend = InMemoryAsyncBackend()
@@ -27,6 +34,41 @@ async def test_delete_existing_and_missing() -> None:
     assert await backend.get("ep1:user:alice") is None
 
 
+@pytest.mark.asyncio
+async def test_bulk_operations_roundtrip() -> None:
+    backend = InMemoryAsyncBackend()
+    await backend.set_many([("ep1:a", "1"), ("ep1:b", "2")])
+    assert await backend.get_many(["ep1:b", "missing", "ep1:a"]) == ["2", None, "1"]
+
+    await backend.delete_many(["ep1:a", "missing"])
+    assert await backend.list_keys("ep1:") == ["ep1:b"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_writes_keep_the_key_index_current() -> None:
+    backend = InMemoryAsyncBackend()
+    await backend.set_many([("ep1:b", "1"), ("ep1:a", "2")])
+    assert await backend.list_keys("ep1:") == ["ep1:a", "ep1:b"]
+    assert await backend.list_keys("ep1:") == ["ep1:a", "ep1:b"]
+
+    await backend.set_many([("ep1:b", "3"), ("ep1:c", "4")])
+    assert await backend.list_keys("ep1:") == ["ep1:a", "ep1:b", "ep1:c"]
+    assert await backend.list_keys("ep1:") == ["ep1:a", "ep1:b", "ep1:c"]
+
+    await backend.delete_many(["ep1:a", "missing"])
+    assert await backend.list_keys("ep1:") == ["ep1:b", "ep1:c"]
+    assert await backend.get_many(["ep1:b", "ep1:c"]) == ["3", "4"]
+
+
+@pytest.mark.asyncio
+async def test_set_if_absent_only_writes_missing_keys() -> None:
+    backend = InMemoryAsyncBackend()
+    assert await backend.set_if_absent("ep1:a", "1") is True
+    assert await backend.set_if_absent("ep1:a", "2") is False
+    assert await backend.get("ep1:a") == "1"
+    assert await backend.list_keys("ep1:") == ["ep1:a"]
+
+
 @pytest.mark.asyncio
 async def test_list_keys_filters_by_prefix_and_sorts() -> None:
     backend = InMemoryAsyncBackend()
@@ -39,9 +81,73 @@ async def test_list_keys_filters_by_prefix_and_sorts() -> None:
     assert await backend.list_keys("missing:") == []
 
 
+@pytest.mark.asyncio
+async def test_list_keys_index_tracks_overwrites_and_deletes() -> None:
+    backend = InMemoryAsyncBackend()
+    await backend.set("ep1:b", "1")
+    await backend.set("ep1:a", "2")
+    await backend.set("ep1:b", "3")
+    await backend.delete("ep1:a")
+    await backend.delete("ep1:a")
+    await backend.set("ep1", "4")
+
+    assert await backend.list_keys("ep1") == ["ep1", "ep1:b"]
+    assert await backend.list_keys("") == ["ep1", "ep1:b"]
+
+
+@pytest.mark.asyncio
+async def test_iter_keys_defaults_to_list_keys() -> None:
+    backend = InMemoryAsyncBackend()
+    await backend.set_many([("ep1:b", "1"), ("ep1:a", "2"), ("ep2:x", "3")])
+
+    assert [key async for key in backend.iter_keys("ep1:")] == ["ep1:a", "ep1:b"]
+
+
+@pytest.mark.asyncio
+async def test_scan_items_defaults_to_keys_and_get_many() -> None:
+    backend = InMemoryAsyncBackend()
+    await backend.set_many([("ep1:b", "1"), ("ep1:a", "2"), ("ep2:x", "3")])
+
+    assert await backend.scan_items("ep1:") == [("ep1:a", "2"), ("ep1:b", "1")]
+
+
+@pytest.mark.asyncio
+async def test_list_top_level_deduplicates_first_segments() -> None:
+    backend = InMemoryAsyncBackend()
+    await backend.set_many([("ep1:a", "1"), ("ep1:a:b", "2"), ("ep1:c:d", "3"), ("ep2:x", "4")])
+
+    assert sorted(await backend.list_top_level("ep1:", ":")) == ["a", "c"]
+
+
 @pytest.mark.asyncio
 async def test_close_is_noop() -> None:
     backend = InMemoryAsyncBackend()
     await backend.set("k", "v")
     await backend.close()
     assert await backend.get("k") == "v"
+
+
+@pytest.mark.asyncio
+async def test_exists_and_exists_many() -> None:
+    backend = InMemoryAsyncBackend()
+    await backend.set("ep1:a", "1")
+    assert await backend.exists("ep1:a")
+    assert not await backend.exists("ep1:b")
+    assert await backend.exists_many(["ep1:b", "ep1:a"]) == [False, True]
+
+
+@pytest.mark.asyncio
+async def test_list_keys_sees_keys_added_and_removed_between_listings() -> None:
+    backend = InMemoryAsyncBackend()
+    await backend.set("ep1:b", "1")
+    await backend.set("ep1:a", "2")
+    assert await backend.list_keys("ep1:") == ["ep1:a", "ep1:b"]
+    assert await backend.list_keys("ep1:") == ["ep1:a", "ep1:b"]
+    assert await backend.list_keys("ep1:b") == ["ep1:b"]
+
+    await backend.set("ep1:c", "3")
+    await backend.delete("ep1:a")
+    await backend.set("ep1:b", "4")
+    assert await backend.list_keys("ep1:") == ["ep1:b", "ep1:c"]
+    assert await backend.list_keys("ep1:") == ["ep1:b", "ep1:c"]
+    assert await backend.list_keys("ep2:") == []
@@ -7,6 +7,7 @@ from kv_dict.key_mapping.nested import reconstruct_nested
 def test_key_mapper_full_key_and_relative_parts() -> None:
     mapper = KeyMapper(entry_point="ep1", sep=":")
     assert mapper.full_key("main", "sup1") == "ep1:main:sup1"
+    assert mapper.full_key_one("main") == mapper.full_key("main") == "ep1:main"
     assert mapper.relative_parts("ep1:main:sup1") == ("main", "sup1")
 
 
@@ -25,6 +26,10 @@ def test_key_mapper_rejects_invalid_inputs() -> None:
         _ = mapper.full_key("")
     with pytest.raises(ValueError, match="key parts must not contain separator"):
         _ = mapper.full_key("bad:key")
+    with pytest.raises(ValueError, match="key parts must not be empty"):
+        _ = mapper.full_key_one("")
+    with pytest.raises(ValueError, match="key parts must not contain separator"):
+        _ = mapper.full_key_one("bad:key")
     with pytest.raises(ValueError, match="key does not match entry point prefix"):
         _ = mapper.relative_parts("ep2:main")
     with pytest.raises(ValueError, match="relative key path must not be empty"):
@@ -46,3 +51,13 @@ def test_reconstruct_nested_dict_leaf_plus_children_merges() -> None:
 def test_reconstruct_nested_scalar_leaf_plus_children_uses_value() -> None:
     data = [((), [1, 2, 3]), (("sub",), {"nested": True})]
     assert reconstruct_nested(data) == {"_value": [1, 2, 3], "sub": {"nested": True}}
+
+
+def test_reconstruct_nested_deep_paths_share_prefixes() -> None:
+    data = [(("a", "b", "c"), 1), (("a", "b", "d"), 2), (("a", "e"), 3), (("a", "b"), {"z": 0})]
+    assert reconstruct_nested(data) == {"a": {"b": {"z": 0, "c": 1, "d": 2}, "e": 3}}
+
+
+def test_reconstruct_nested_without_items_raises_value_error() -> None:
+    with pytest.raises(ValueError, match="no leaf and no children"):
+        _ = reconstruct_nested([])
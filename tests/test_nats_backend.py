@@ -2,6 +2,7 @@ import pytest
 
 from kv_dict.backends import nats as nats_module
 from kv_dict.backends.nats import NatsBackend
+from kv_dict.mappings.remote import RemoteKVMapping
 
 
 class BucketNotFoundError(Exception):
@@ -16,6 +17,10 @@ class NoKeysError(Exception):
     pass
 
 
+class KeyWrongLastSequenceError(Exception):
+    pass
+
+
 class _FakeEntry:
     def __init__(self, value: bytes | str) -> None:
         self.value = value
@@ -35,6 +40,11 @@ class _FakeKVBucket:
     async def put(self, key: str, value: bytes) -> None:
         self.store[key] = value
 
+    async def create(self, key: str, value: bytes) -> None:
+        if key in self.store:
+            raise KeyWrongLastSequenceError
+        self.store[key] = value
+
     async def delete(self, key: str) -> None:
         _ = self.store.pop(key, None)
 
@@ -79,12 +89,21 @@ async def test_nats_backend_get_set_delete_roundtrip_existing_bucket() -> None:
     backend = NatsBackend(client=_FakeNatsClient({"kv_dict": bucket}), bucket="kv_dict")
 
     await backend.set("ep1:user", '{"alice": true}')
-    assert await backend.get("ep1:user") == '{"alice": true}'
+    assert await backend.get("ep1:user") == b'{"alice": true}'
 
     await backend.delete("ep1:user")
     assert await backend.get("ep1:user") is None
 
 
+@pytest.mark.asyncio
+async def test_nats_backend_set_stores_bytes_without_reencoding() -> None:
+    bucket = _FakeKVBucket()
+    backend = NatsBackend(client=_FakeNatsClient({"kv_dict": bucket}), bucket="kv_dict")
+
+    await backend.set("ep1:user", b'{"alice": true}')
+    assert bucket.store == {"ep1:user": b'{"alice": true}'}
+
+
 @pytest.mark.asyncio
 async def test_nats_backend_list_keys_filters_and_sorts() -> None:
     bucket = _FakeKVBucket()
@@ -110,7 +129,7 @@ async def test_nats_backend_missing_bucket_can_be_created_when_enabled() -> None
     backend = NatsBackend(client=_FakeNatsClient({}), bucket="kv_dict", create_bucket=True)
 
     await backend.set("ep1:user", "value")
-    assert await backend.get("ep1:user") == "value"
+    assert await backend.get("ep1:user") == b"value"
 
 
 @pytest.mark.asyncio
@@ -135,3 +154,24 @@ async def test_nats_backend_requires_dependency_without_injected_client(monkeypa
 
     with pytest.raises(RuntimeError, match="nats-py dependency is required"):
         _ = await backend.get("ep1:user")
+
+
+@pytest.mark.asyncio
+async def test_nats_backend_set_if_absent_uses_create() -> None:
+    bucket = _FakeKVBucket()
+    backend = NatsBackend(client=_FakeNatsClient({"kv_dict": bucket}), bucket="kv_dict")
+
+    assert await backend.set_if_absent("ep1:a", "1") is True
+    assert await backend.set_if_absent("ep1:a", "2") is False
+    assert bucket.store == {"ep1:a": b"1"}
+
+
+def test_nats_backend_values_decode_through_remote_mapping() -> None:
+    bucket = _FakeKVBucket()
+    mapping = RemoteKVMapping(backend=NatsBackend(client=_FakeNatsClient({"kv_dict": bucket})), entry_point="ep1")
+    try:
+        mapping["user"] = {"alice": {"age": 30}}
+        assert bucket.store == {"ep1:user": b'{"alice": {"age": 30}}'}
+        assert mapping["user"] == {"alice": {"age": 30}}
+    finally:
+        mapping.close()
@@ -1,3 +1,5 @@
+import re
+
 import pytest
 
 from kv_dict.backends import postgres as postgres_module
@@ -8,6 +10,22 @@ class UndefinedTableError(Exception):
     pass
 
 
+def _like(pattern: str, key: str) -> bool:
+    # LIKE semantics with ``\`` as the escape character, so escaping mistakes in the backend show up here.
+    regex = ""
+    chars = iter(pattern)
+    for char in chars:
+        if char == "\\":
+            regex += re.escape(next(chars))
+        elif char == "%":
+            regex += ".*"
+        elif char == "_":
+            regex += "."
+        else:
+            regex += re.escape(char)
+    return re.fullmatch(regex, key, re.DOTALL) is not None
+
+
 class _FakePostgresClient:
     def __init__(self, *, table_exists: bool = True) -> None:
         super().__init__()
@@ -15,20 +33,38 @@ class _FakePostgresClient:
         self.closed = False
         self.table_exists = table_exists
 
-    async def fetchrow(self, _query: str, key: str) -> dict[str, str] | None:
+    async def fetchrow(self, query: str, key: str, *extra: int | str) -> dict[str, str] | list[int] | None:
         if not self.table_exists:
             raise UndefinedTableError
+        if query.startswith("SELECT count(DISTINCT"):
+            start, sep = extra
+            segments = {k[int(start) - 1 :].split(str(sep), 1)[0] for k in self.store if _like(key, k)}
+            return [len(segments - {""})]
         if key not in self.store:
             return None
         return {"v": self.store[key]}
 
-    async def fetch(self, _query: str, pattern: str) -> list[dict[str, str]]:
+    async def fetch(self, query: str, arg: str | list[str], *extra: int | str) -> list[dict[str, str]]:
         if not self.table_exists:
             raise UndefinedTableError
-        prefix = pattern.removesuffix("%")
-        return [{"k": key} for key in sorted(self.store) if key.startswith(prefix)]
-
-    async def execute(self, query: str, *args: str) -> str:
+        if query.startswith("SELECT DISTINCT split_part"):
+            start, sep = extra
+            segments = {key[int(start) - 1 :].split(str(sep), 1)[0] for key in self.store if _like(str(arg), key)}
+            return [{"segment": segment} for segment in segments]
+        if isinstance(arg, list):
+            return [{"k": key, "v": self.store[key]} for key in arg if key in self.store]
+        matching = [key for key in sorted(self.store) if _like(arg, key)]
+        if query.startswith("SELECT k, v"):
+            return [{"k": key, "v": self.store[key]} for key in matching]
+        return [{"k": key} for key in matching]
+
+    def _insert_if_absent(self, key: str, value: str) -> str:
+        if key in self.store:
+            return "INSERT 0 0"
+        self.store[key] = value
+        return "INSERT 0 1"
+
+    async def execute(self, query: str, *args: str | list[str]) -> str:
         if query.startswith("CREATE TABLE IF NOT EXISTS"):
             self.table_exists = True
             return "CREATE TABLE"
@@ -36,14 +72,20 @@ class _FakePostgresClient:
         if not self.table_exists:
             raise UndefinedTableError
 
+        if query.startswith("INSERT INTO") and query.endswith("DO NOTHING"):
+            return self._insert_if_absent(str(args[0]), str(args[1]))
         if query.startswith("INSERT INTO"):
-            key, value = args
-            self.store[key] = value
+            keys, values = args
+            if isinstance(keys, list) and isinstance(values, list):
+                self.store.update(zip(keys, values, strict=True))
+                return f"INSERT 0 {len(keys)}"
+            self.store[str(keys)] = str(values)
             return "INSERT 0 1"
         if query.startswith("DELETE FROM"):
-            key = args[0]
-            _ = self.store.pop(key, None)
-            return "DELETE 1"
+            keys = args[0] if isinstance(args[0], list) else [args[0]]
+            for key in keys:
+                _ = self.store.pop(key, None)
+            return f"DELETE {len(keys)}"
 
         return "OK"
 
@@ -62,6 +104,29 @@ async def test_postgres_backend_get_set_delete_roundtrip() -> None:
     assert await backend.get("ep1:user") is None
 
 
+@pytest.mark.asyncio
+async def test_postgres_backend_bulk_operations_roundtrip() -> None:
+    client = _FakePostgresClient(table_exists=True)
+    backend = PostgresBackend(client=client)
+
+    await backend.set_many([("ep1:a", "1"), ("ep1:b", "2"), ("ep1:a", "3")])
+    assert client.store == {"ep1:a": "3", "ep1:b": "2"}
+    assert await backend.get_many(["ep1:b", "missing", "ep1:a"]) == ["2", None, "3"]
+
+    await backend.delete_many(["ep1:a", "missing"])
+    assert client.store == {"ep1:b": "2"}
+
+
+@pytest.mark.asyncio
+async def test_postgres_backend_decodes_bytes_values_for_text_column() -> None:
+    client = _FakePostgresClient(table_exists=True)
+    backend = PostgresBackend(client=client)
+
+    await backend.set("ep1:a", b"1")
+    await backend.set_many([("ep1:b", b"2")])
+    assert client.store == {"ep1:a": "1", "ep1:b": "2"}
+
+
 @pytest.mark.asyncio
 async def test_postgres_backend_list_keys_filters_and_sorts() -> None:
     backend = PostgresBackend(client=_FakePostgresClient(table_exists=True))
@@ -110,3 +175,81 @@ async def test_postgres_backend_requires_dependency_without_injected_client(monk
 def test_postgres_backend_rejects_invalid_table_identifier() -> None:
     with pytest.raises(ValueError, match="valid unquoted SQL identifier"):
         _ = PostgresBackend(table="kv-store")
+
+
+@pytest.mark.asyncio
+async def test_postgres_backend_creates_pool_with_statement_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    created: list[tuple[str, dict[str, int]]] = []
+    pool = _FakePostgresClient(table_exists=True)
+
+    class _FakeAsyncpg:
+        @staticmethod
+        async def create_pool(dsn: str, **kwargs: int) -> _FakePostgresClient:
+            created.append((dsn, kwargs))
+            return pool
+
+    monkeypatch.setattr(postgres_module, "asyncpg_module", _FakeAsyncpg)
+    backend = PostgresBackend("postgresql://db/kv", max_pool_size=4, statement_cache_size=64)
+
+    await backend.set("ep1:a", "1")
+    assert await backend.get("ep1:a") == "1"
+    assert created == [("postgresql://db/kv", {"min_size": 2, "max_size": 4, "statement_cache_size": 64})]
+
+
+@pytest.mark.asyncio
+async def test_postgres_backend_set_if_absent_reports_whether_row_was_inserted() -> None:
+    client = _FakePostgresClient(table_exists=True)
+    backend = PostgresBackend(client=client)
+
+    assert await backend.set_if_absent("ep1:a", b"1") is True
+    assert await backend.set_if_absent("ep1:a", "2") is False
+    assert client.store == {"ep1:a": "1"}
+
+
+@pytest.mark.asyncio
+async def test_postgres_backend_scan_items_reads_keys_and_values_in_one_query() -> None:
+    client = _FakePostgresClient(table_exists=True)
+    backend = PostgresBackend(client=client)
+    client.store.update({"ep1:a": "1", "ep1:b": "2", "ep2:c": "3"})
+
+    assert sorted(await backend.scan_items("ep1:")) == [("ep1:a", "1"), ("ep1:b", "2")]
+
+
+@pytest.mark.asyncio
+async def test_postgres_backend_list_top_level_groups_segments_server_side() -> None:
+    client = _FakePostgresClient(table_exists=True)
+    backend = PostgresBackend(client=client)
+    client.store.update({"ep1:a": "1", "ep1:a:b": "2", "ep1:c:d:e": "3", "ep2:x": "4"})
+
+    assert sorted(await backend.list_top_level("ep1:", ":")) == ["a", "c"]
+
+
+@pytest.mark.asyncio
+async def test_postgres_backend_escapes_like_wildcards_in_prefixes() -> None:
+    backend = PostgresBackend(client=_FakePostgresClient(table_exists=True))
+    await backend.set_many([("my_app:user_1:a", "1"), ("my_app:userX1:b", "2"), ("myXapp:c", "3"), ("my%app:d", "4")])
+
+    assert await backend.list_keys("my_app:user_1:") == ["my_app:user_1:a"]
+    assert await backend.scan_items("my_app:user_1:") == [("my_app:user_1:a", "1")]
+    assert sorted(await backend.list_top_level("my_app:", ":")) == ["userX1", "user_1"]
+    assert await backend.list_keys("my%app:") == ["my%app:d"]
+
+
+@pytest.mark.asyncio
+async def test_postgres_backend_exists_and_exists_many() -> None:
+    backend = PostgresBackend(client=_FakePostgresClient(table_exists=True))
+    await backend.set("ep1:a", "1")
+
+    assert await backend.exists("ep1:a")
+    assert not await backend.exists("ep1:b")
+    assert await backend.exists_many(["ep1:b", "ep1:a"]) == [False, True]
+    assert await backend.exists_many([]) == []
+
+
+@pytest.mark.asyncio
+async def test_postgres_backend_counts_top_level_segments_server_side() -> None:
+    backend = PostgresBackend(client=_FakePostgresClient(table_exists=True))
+    await backend.set_many([("ep1:a", "1"), ("ep1:a:b", "2"), ("ep1:c:d", "3"), ("ep2:e", "4")])
+
+    assert await backend.count_top_level("ep1:", ":") == len(["a", "c"])
+    assert await backend.count_top_level("ep3:", ":") == 0
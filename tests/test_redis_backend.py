@@ -1,41 +1,138 @@
+import asyncio
+import re
+
 import pytest
 
+from kv_dict.backends import redis as redis_module
 from kv_dict.backends.redis import RedisBackend
 
 
+def _glob_match(pattern: str, key: str) -> bool:
+    # Redis glob semantics (``*``, ``?``, ``[...]`` and ``\`` escapes), so unescaped prefixes show up here.
+    regex = ""
+    chars = iter(pattern)
+    for char in chars:
+        if char == "\\":
+            regex += re.escape(next(chars))
+        elif char == "*":
+            regex += ".*"
+        elif char == "?":
+            regex += "."
+        elif char == "[":
+            members = ""
+            for member in chars:
+                if member == "]":
+                    break
+                members += re.escape(member)
+            regex += f"[{members}]"
+        else:
+            regex += re.escape(char)
+    return re.fullmatch(regex, key, re.DOTALL) is not None
+
+
 class _FakeRedisClient:
     def __init__(self) -> None:
         self.store: dict[str, str] = {}
         self.closed = False
+        self.scan_counts: list[int | None] = []
+        self.mget_calls: list[list[str]] = []
+        self.unlinked: list[str] = []
 
     async def get(self, key: str) -> str | None:
         return self.store.get(key)
 
-    async def set(self, key: str, value: str) -> None:
+    async def exists(self, *keys: str) -> int:
+        return sum(key in self.store for key in keys)
+
+    async def set(self, key: str, value: str, *, nx: bool = False) -> bool | None:
+        if nx and key in self.store:
+            return None
         self.store[key] = value
+        return True
 
-    async def delete(self, key: str) -> None:
-        self.store.pop(key, None)
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.store.pop(key, None)
 
-    async def scan_iter(self, match: str):
-        prefix = match.removesuffix("*")
+    async def unlink(self, *keys: str) -> None:
+        self.unlinked.extend(keys)
+        await self.delete(*keys)
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        self.mget_calls.append(list(keys))
+        return [self.store.get(key) for key in keys]
+
+    async def mset(self, mapping: dict[str, str]) -> None:
+        self.store.update(mapping)
+
+    async def scan_iter(self, match: str, count: int | None = None):
+        self.scan_counts.append(count)
         for key in sorted(self.store.keys()):
-            if key.startswith(prefix):
+            if _glob_match(match, key):
                 yield key
 
     async def aclose(self) -> None:
         self.closed = True
 
 
+class _FakePipeline:
+    def __init__(self, client: _FakePipelinedRedisClient) -> None:
+        self._client = client
+        self._commands: list[tuple[str, tuple[str, ...]]] = []
+
+    def get(self, key: str) -> _FakePipeline:
+        self._commands.append(("get", (key,)))
+        return self
+
+    def set(self, key: str, value: str) -> _FakePipeline:
+        self._commands.append(("set", (key, value)))
+        return self
+
+    def delete(self, *keys: str) -> _FakePipeline:
+        self._commands.append(("delete", keys))
+        return self
+
+    def exists(self, *keys: str) -> _FakePipeline:
+        self._commands.append(("exists", keys))
+        return self
+
+    def unlink(self, *keys: str) -> _FakePipeline:
+        self._commands.append(("unlink", keys))
+        return self
+
+    async def execute(self, *, raise_on_error: bool = True) -> list[object]:
+        assert raise_on_error is False
+        self._client.executed.append([command for command, _args in self._commands])
+        results: list[object] = []
+        for command, args in self._commands:
+            if command == "get" and args[0] == "boom":
+                results.append(ValueError("boom"))
+                continue
+            results.append(await getattr(self._client, command)(*args))
+        return results
+
+
+class _FakePipelinedRedisClient(_FakeRedisClient):
+    def __init__(self) -> None:
+        super().__init__()
+        self.executed: list[list[str]] = []
+
+    def pipeline(self, *, transaction: bool = True) -> _FakePipeline:
+        assert transaction is False
+        return _FakePipeline(self)
+
+
 class _FakeBytesRedisClient(_FakeRedisClient):
     async def get(self, key: str) -> bytes | None:
         value = self.store.get(key)
         return value.encode() if value is not None else None
 
-    async def scan_iter(self, match: str):
-        prefix = match.removesuffix("*")
+    async def mget(self, keys: list[str]) -> list[bytes | None]:
+        return [await self.get(key) for key in keys]
+
+    async def scan_iter(self, match: str, count: int | None = None):
         for key in sorted(self.store.keys()):
-            if key.startswith(prefix):
+            if _glob_match(match, key):
                 yield key.encode()
 
 
@@ -52,7 +149,7 @@ class _FakeCloseOnlyClient:
     async def delete(self, key: str) -> None:
         return
 
-    async def scan_iter(self, match: str):
+    async def scan_iter(self, match: str, count: int | None = None):
         if False:
             yield match
 
@@ -72,6 +169,20 @@ async def test_redis_backend_get_set_delete_roundtrip() -> None:
     assert await backend.get("ep1:user") is None
 
 
+@pytest.mark.asyncio
+async def test_redis_backend_bulk_operations_use_native_commands() -> None:
+    client = _FakeRedisClient()
+    backend = RedisBackend(client=client)
+
+    await backend.set_many([("ep1:a", "1"), ("ep1:b", "2")])
+    assert client.store == {"ep1:a": "1", "ep1:b": "2"}
+    assert await backend.get_many(["ep1:b", "missing", "ep1:a"]) == ["2", None, "1"]
+
+    await backend.delete_many(["ep1:a", "missing"])
+    assert client.store == {"ep1:b": "2"}
+    assert await backend.get_many([]) == []
+
+
 @pytest.mark.asyncio
 async def test_redis_backend_list_keys_filters_and_sorts() -> None:
     client = _FakeRedisClient()
@@ -84,6 +195,17 @@ async def test_redis_backend_list_keys_filters_and_sorts() -> None:
     assert await backend.list_keys("ep1:") == ["ep1:a", "ep1:z"]
 
 
+@pytest.mark.asyncio
+async def test_redis_backend_scan_uses_configured_count() -> None:
+    client = _FakeRedisClient()
+    default_backend = RedisBackend(client=client)
+    tuned_backend = RedisBackend(client=client, scan_count=50)
+
+    _ = await default_backend.list_keys("ep1:")
+    _ = [key async for key in tuned_backend.iter_keys("ep1:")]
+    assert client.scan_counts == [1000, 50]
+
+
 @pytest.mark.asyncio
 async def test_redis_backend_normalizes_bytes_from_client() -> None:
     client = _FakeBytesRedisClient()
@@ -110,3 +232,145 @@ async def test_redis_backend_close_requires_aclose() -> None:
 
     with pytest.raises(AttributeError):
         await backend.close()
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_auto_pipeline_batches_concurrent_commands() -> None:
+    client = _FakePipelinedRedisClient()
+    backend = RedisBackend(client=client, auto_pipeline=True)
+
+    await asyncio.gather(backend.set("ep1:a", "1"), backend.set("ep1:b", "2"), backend.delete("ep1:c"))
+    values = await asyncio.gather(backend.get("ep1:a"), backend.get("ep1:b"), backend.get("missing"))
+
+    assert values == ["1", "2", None]
+    assert client.executed == [["set", "set", "unlink"], ["get", "get", "get"]]
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_auto_pipeline_delivers_command_errors_to_their_caller() -> None:
+    client = _FakePipelinedRedisClient()
+    backend = RedisBackend(client=client, auto_pipeline=True)
+    await backend.set("ep1:a", "1")
+
+    ok, failed = await asyncio.gather(backend.get("ep1:a"), backend.get("boom"), return_exceptions=True)
+
+    assert ok == "1"
+    assert isinstance(failed, ValueError)
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_set_if_absent_uses_set_nx() -> None:
+    client = _FakeRedisClient()
+    backend = RedisBackend(client=client)
+
+    assert await backend.set_if_absent("ep1:a", "1") is True
+    assert await backend.set_if_absent("ep1:a", "2") is False
+    assert client.store == {"ep1:a": "1"}
+
+
+def test_redis_backend_builds_client_on_blocking_connection_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    created: list[tuple[str, dict[str, object]]] = []
+    client = _FakeRedisClient()
+
+    class _FakeBlockingConnectionPool:
+        @staticmethod
+        def from_url(url: str, **kwargs: object) -> tuple[str, dict[str, object]]:
+            created.append((url, kwargs))
+            return created[-1]
+
+    class _FakeRedis:
+        @staticmethod
+        def from_pool(pool: object) -> _FakeRedisClient:
+            assert pool is created[-1]
+            return client
+
+    class _FakeRedisAsync:
+        BlockingConnectionPool = _FakeBlockingConnectionPool
+        Redis = _FakeRedis
+
+    monkeypatch.setattr(redis_module, "redis_async", _FakeRedisAsync)
+    backend = RedisBackend("redis://cache:6379/1", max_connections=4, socket_timeout=2.5)
+
+    assert backend._client is client
+    assert created == [
+        (
+            "redis://cache:6379/1",
+            {
+                "max_connections": 4,
+                "decode_responses": True,
+                "socket_keepalive": True,
+                "health_check_interval": 30,
+                "socket_timeout": 2.5,
+            },
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_iter_keys_streams_scan_order() -> None:
+    class _UnorderedScanClient(_FakeRedisClient):
+        async def scan_iter(self, match: str, count: int | None = None):
+            prefix = match.removesuffix("*")
+            for key in sorted(self.store, reverse=True):
+                if key.startswith(prefix):
+                    yield key.encode()
+
+    backend = RedisBackend(client=_UnorderedScanClient())
+    await backend.set_many([("ep1:a", "1"), ("ep1:b", "2"), ("ep2:c", "3")])
+
+    assert [key async for key in backend.iter_keys("ep1:")] == ["ep1:b", "ep1:a"]
+    assert await backend.list_keys("ep1:") == ["ep1:a", "ep1:b"]
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_scan_items_reads_scanned_keys_in_mget_chunks() -> None:
+    client = _FakeRedisClient()
+    backend = RedisBackend(client=client, mget_chunk_size=2)
+    client.store.update({"ep1:a": "1", "ep1:b": "2", "ep1:c": "3", "ep2:d": "4"})
+
+    assert await backend.scan_items("ep1:") == [("ep1:a", "1"), ("ep1:b", "2"), ("ep1:c", "3")]
+    assert client.mget_calls == [["ep1:a", "ep1:b"], ["ep1:c"]]
+    assert await backend.scan_items("missing:") == []
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_can_return_raw_bytes_values() -> None:
+    backend = RedisBackend(client=_FakeBytesRedisClient(), decode_responses=False)
+    await backend.set_many([("ep1:a", '{"x": 1}'), ("ep1:b", "2")])
+
+    assert await backend.get("ep1:a") == b'{"x": 1}'
+    assert await backend.get_many(["ep1:b", "missing"]) == [b"2", None]
+    assert await backend.scan_items("ep1:") == [("ep1:a", b'{"x": 1}'), ("ep1:b", b"2")]
+    assert await backend.list_keys("ep1:") == ["ep1:a", "ep1:b"]
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_deletes_with_unlink_unless_disabled() -> None:
+    client = _FakeRedisClient()
+    await RedisBackend(client=client).set_many([("ep1:a", "1"), ("ep1:b", "2"), ("ep1:c", "3")])
+
+    await RedisBackend(client=client).delete("ep1:a")
+    await RedisBackend(client=client).delete_many(["ep1:b"])
+    await RedisBackend(client=client, unlink=False).delete("ep1:c")
+
+    assert client.unlinked == ["ep1:a", "ep1:b"]
+    assert client.store == {}
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_escapes_glob_characters_in_scan_prefix() -> None:
+    client = _FakeRedisClient()
+    backend = RedisBackend(client=client)
+    await backend.set_many([("ep1:a*b:x", "1"), ("ep1:aXb:y", "2"), ("ep1:a?[b]:z", "3"), ("ep1:a!b]:w", "4")])
+
+    assert await backend.list_keys("ep1:a*b:") == ["ep1:a*b:x"]
+    assert await backend.list_keys("ep1:a?[b]:") == ["ep1:a?[b]:z"]
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_exists_checks_keys_without_reading_values() -> None:
+    backend = RedisBackend(client=_FakeRedisClient())
+    await backend.set("ep1:a", "1")
+
+    assert await backend.exists("ep1:a")
+    assert await backend.exists_many(["ep1:a", "ep1:b"]) == [True, False]
@@ -1,4 +1,9 @@
-from typing import TYPE_CHECKING
+import asyncio
+import json
+import re
+from array import array
+from functools import partial
+from typing import TYPE_CHECKING, Any, override
 
 
 if TYPE_CHECKING:
@@ -9,6 +14,7 @@ from hypothesis import given
 from hypothesis import strategies as st
 
 from kv_dict.backends.in_memory import InMemoryAsyncBackend
+from kv_dict.mappings import remote as remote_module
 from kv_dict.mappings.remote import RemoteKVMapping, _AsyncLoopBridge, _WriteThroughDict, _WriteThroughList
 
 
@@ -21,6 +27,15 @@ _JSON_VALUES = st.recursive(
 )
 
 
+class _LooseLikeBackend(InMemoryAsyncBackend):
+    """Backend whose prefix queries treat ``_`` as a wildcard, like an unescaped SQL ``LIKE``."""
+
+    @override
+    async def list_keys(self, prefix: str) -> list[str]:
+        pattern = re.compile(re.escape(prefix).replace("_", ".") + ".*", re.DOTALL)
+        return sorted(key for key in await super().list_keys("") if pattern.fullmatch(key))
+
+
 @pytest.fixture
 def mapping() -> Generator[RemoteKVMapping]:
     test_mapping = RemoteKVMapping(backend=InMemoryAsyncBackend(), entry_point="ep1", sep=":")
@@ -40,6 +55,42 @@ def test_remote_mapping_set_get_delete_and_len(mapping: RemoteKVMapping) -> None
     assert len(mapping) == 0
 
 
+def test_remote_mapping_defaults_to_stdlib_json_semantics(mapping: RemoteKVMapping) -> None:
+    mapping["big"] = 2**70
+    mapping["keys"] = {1: "one"}
+    mapping["nan"] = float("nan")
+
+    assert mapping["big"] == 2**70
+    assert mapping["keys"] == {"1": "one"}
+    assert mapping["nan"] != mapping["nan"]
+
+
+def test_remote_mapping_accepts_bytes_encoder() -> None:
+    backend = InMemoryAsyncBackend()
+    test_mapping = RemoteKVMapping(
+        backend=backend, entry_point="ep1", json_encoder=lambda value: json.dumps(value).encode()
+    )
+    try:
+        test_mapping["user"] = {"name": "alice", "tags": [1, 2]}
+        assert test_mapping["user"] == {"name": "alice", "tags": [1, 2]}
+        assert test_mapping._bridge.run(backend.get("ep1:user")) == b'{"name": "alice", "tags": [1, 2]}'
+    finally:
+        test_mapping.close()
+
+
+def test_remote_mapping_orjson_opt_in_roundtrip() -> None:
+    orjson = pytest.importorskip("orjson")
+    test_mapping = RemoteKVMapping(
+        backend=InMemoryAsyncBackend(), entry_point="ep1", json_encoder=orjson.dumps, json_decoder=orjson.loads
+    )
+    try:
+        test_mapping["user"] = {"name": "alice", "tags": [1, 2]}
+        test_mapping["user"]["tags"].append(3)
+        assert test_mapping["user"] == {"name": "alice", "tags": [1, 2, 3]}
+    finally:
+        test_mapping.close()
+
+
 def test_remote_mapping_reconstructs_nested_children_under_top_key(mapping: RemoteKVMapping) -> None:
     mapping._bridge.run(mapping._backend.set("ep1:main:sup1", '{"key": "value"}'))
     mapping._bridge.run(mapping._backend.set("ep1:main:sup2", "[1, 2, 3]"))
@@ -174,6 +225,19 @@ def test_remote_mapping_returns_write_through_list_wrappers(mapping: RemoteKVMap
     assert isinstance(result[2], _WriteThroughList)
 
 
+def test_write_through_wrappers_compare_with_plain_values_and_each_other(mapping: RemoteKVMapping) -> None:
+    mapping["user"] = {"alice": {"tags": [1, 2]}}
+    user = mapping["user"]
+
+    assert user == {"alice": {"tags": [1, 2]}}
+    assert user == mapping["user"]
+    assert {"alice": user["alice"]} == user
+    assert user["alice"]["tags"] == [1, 2]
+    assert user["alice"]["tags"] == mapping["user"]["alice"]["tags"]
+    assert user != {"alice": {"tags": [1, 3]}}
+    assert user["alice"]["tags"] != (1, 2)
+
+
 def test_write_through_dict_hash_raises_type_error(mapping: RemoteKVMapping) -> None:
     mapping["user"] = {"alice": {"age": 30}}
     user = mapping["user"]
@@ -202,6 +266,20 @@ def test_async_loop_bridge_run_raises_runtime_error_when_loop_is_uninitialized()
         bridge.close()
 
 
+def test_async_loop_bridge_run_many_returns_results_in_order() -> None:
+    bridge = _AsyncLoopBridge()
+
+    async def echo(value: str) -> str:
+        await asyncio.sleep(0)
+        return value
+
+    try:
+        assert bridge.run_many(echo(value) for value in "abc") == ["a", "b", "c"]
+        assert bridge.run_many([]) == []
+    finally:
+        bridge.close()
+
+
 def test_remote_mapping_getitem_raises_key_error_when_backend_gets_none(mapping: RemoteKVMapping) -> None:
     mapping["user"] = {"alice": {"age": 30}}
 
@@ -226,6 +304,7 @@ def test_remote_mapping_copy_returns_plain_detached_snapshot(mapping: RemoteKVMa
 
     assert snapshot == {"user": {"alice": {"age": expected_age}}}
     assert isinstance(snapshot, dict)
+    assert type(snapshot["user"]) is dict
 
     snapshot["user"]["alice"]["age"] = 99
     assert mapping["user"]["alice"]["age"] == expected_age
@@ -233,27 +312,19 @@ def test_remote_mapping_copy_returns_plain_detached_snapshot(mapping: RemoteKVMa
 
 @given(key=_KEYS, value=_JSON_VALUES)
 def test_remote_mapping_roundtrip_property(key: str, value: object) -> None:
-    backend = InMemoryAsyncBackend()
-    mapping = RemoteKVMapping(backend=backend, entry_point="ep1", sep=":")
-    try:
+    with RemoteKVMapping(backend=InMemoryAsyncBackend(), entry_point="ep1", sep=":") as mapping:
         mapping[key] = value
         assert mapping[key] == value
-    finally:
-        mapping.close()
 
 
 @given(payload=st.dictionaries(keys=_KEYS, values=_JSON_VALUES, max_size=10))
 def test_remote_mapping_multi_key_property(payload: dict[str, object]) -> None:
-    backend = InMemoryAsyncBackend()
-    mapping = RemoteKVMapping(backend=backend, entry_point="ep1", sep=":")
-    try:
+    with RemoteKVMapping(backend=InMemoryAsyncBackend(), entry_point="ep1", sep=":") as mapping:
         mapping.update(payload)
         assert len(mapping) == len(payload)
         assert list(mapping) == sorted(payload.keys())
         for key, expected in payload.items():
             assert mapping[key] == expected
-    finally:
-        mapping.close()
 
 
 def _assert_ior(mapping: RemoteKVMapping, operand: object, expected: dict[str, object]) -> None:
@@ -303,12 +374,751 @@ def test_remote_mapping_or_returns_detached_merged_snapshot(mapping: RemoteKVMap
     other=st.dictionaries(keys=_KEYS, values=_JSON_VALUES, max_size=8),
 )
 def test_remote_mapping_or_matches_dict_union_property(base: dict[str, object], other: dict[str, object]) -> None:
-    backend = InMemoryAsyncBackend()
-    mapping = RemoteKVMapping(backend=backend, entry_point="ep1", sep=":")
-    try:
+    with RemoteKVMapping(backend=InMemoryAsyncBackend(), entry_point="ep1", sep=":") as mapping:
         mapping.update(base)
         expected = dict(base) | dict(other)
         _assert_union(mapping, other, expected)
         assert mapping.copy() == base
+
+
+def test_remote_mapping_get_many_and_set_many_roundtrip(mapping: RemoteKVMapping) -> None:
+    mapping.set_many([("a", {"value": 1}), ("b", [1, 2])])
+
+    assert mapping.get_many(["b", "a"]) == [[1, 2], {"value": 1}]
+    with pytest.raises(KeyError, match="missing"):
+        _ = mapping.get_many(["a", "missing"])
+
+
+def test_remote_mapping_autopipeline_defers_writes_until_exit(mapping: RemoteKVMapping) -> None:
+    with mapping.autopipeline():
+        mapping["a"] = 1
+        mapping["b"] = 2
+        assert mapping._bridge.run(mapping._backend.list_keys("ep1:")) == []
+
+    assert mapping.copy() == {"a": 1, "b": 2}
+
+
+def test_remote_mapping_autopipeline_reads_observe_buffered_writes(mapping: RemoteKVMapping) -> None:
+    with mapping.autopipeline():
+        mapping["a"] = {"value": 1}
+        assert mapping["a"] == {"value": 1}
+        assert list(mapping) == ["a"]
+
+
+def test_remote_mapping_prefetch_serves_reads_from_snapshot() -> None:
+    backend = InMemoryAsyncBackend()
+    writer = RemoteKVMapping(backend=backend, entry_point="ep1", sep=":")
+    writer["user"] = {"alice": {"age": 30}}
+    writer["other"] = 1
+
+    mapping = RemoteKVMapping(backend=backend, entry_point="ep1", sep=":", prefetch=True)
+    try:
+        writer["user"] = "changed elsewhere"
+        assert mapping["user"] == {"alice": {"age": 30}}
+        assert list(mapping) == ["other", "user"]
+
+        mapping["user"]["alice"]["age"] = 31
+        assert mapping["user"] == {"alice": {"age": 31}}
+        assert writer["user"] == {"alice": {"age": 31}}
+
+        del mapping["other"]
+        assert "other" not in mapping
+        assert "other" not in writer
+    finally:
+        mapping.close()
+        writer.close()
+
+
+def test_remote_mapping_prefetch_snapshot_is_indexed_by_top_level_key() -> None:
+    backend = InMemoryAsyncBackend()
+    writer = RemoteKVMapping(backend=backend, entry_point="ep1", sep=":")
+    writer["foo"] = {"a": 1}
+    writer._bridge.run(backend.set("ep1:foo:b", "2"))
+    writer["foobar"] = "sibling"
+
+    mapping = RemoteKVMapping(backend=backend, entry_point="ep1", sep=":", prefetch=True)
+    try:
+        assert mapping["foo"] == {"a": 1, "b": 2}
+        assert mapping["foobar"] == "sibling"
+
+        mapping["new"] = [1]
+        assert list(mapping) == ["foo", "foobar", "new"]
+
+        del mapping["foo"]
+        assert list(mapping) == ["foobar", "new"]
+        assert mapping["foobar"] == "sibling"
+    finally:
+        mapping.close()
+        writer.close()
+
+
+def test_remote_mapping_cache_serves_repeated_reads_and_invalidates_on_write() -> None:
+    backend = InMemoryAsyncBackend()
+    mapping = RemoteKVMapping(backend=backend, entry_point="ep1", sep=":", cache_size=2)
+    try:
+        mapping["a"] = {"value": 1}
+        assert mapping["a"] == {"value": 1}
+
+        mapping._bridge.run(backend.set("ep1:a", '{"value": 2}'))
+        assert mapping["a"] == {"value": 1}
+
+        mapping["a"]["value"] = 3
+        assert mapping["a"] == {"value": 3}
+
+        del mapping["a"]
+        with pytest.raises(KeyError):
+            _ = mapping["a"]
+    finally:
+        mapping.close()
+
+
+def test_remote_mapping_cache_evicts_least_recently_used_entries() -> None:
+    backend = InMemoryAsyncBackend()
+    mapping = RemoteKVMapping(backend=backend, entry_point="ep1", sep=":", cache_size=1)
+    try:
+        mapping.update({"a": "old", "b": "old"})
+        assert mapping.get_many(["a", "b"]) == ["old", "old"]
+
+        mapping._bridge.run(backend.set_many([("ep1:a", '"new"'), ("ep1:b", '"new"')]))
+        assert mapping["b"] == "old"
+        assert mapping["a"] == "new"
+    finally:
+        mapping.close()
+
+
+def test_remote_mapping_cache_ttl_expires_entries() -> None:
+    backend = InMemoryAsyncBackend()
+    mapping = RemoteKVMapping(backend=backend, entry_point="ep1", sep=":", cache_size=4, cache_ttl=0)
+    try:
+        mapping["a"] = "old"
+        assert mapping["a"] == "old"
+
+        mapping._bridge.run(backend.set("ep1:a", '"new"'))
+        assert mapping["a"] == "new"
+    finally:
+        mapping.close()
+
+
+class _CountingBackend(InMemoryAsyncBackend):
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes: list[list[tuple[str, str]]] = []
+
+    async def set(self, key: str, value: str) -> None:
+        self.writes.append([(key, value)])
+        await super().set(key, value)
+
+    async def set_many(self, items: list[tuple[str, str]]) -> None:
+        self.writes.append(list(items))
+        for key, value in items:
+            await super().set(key, value)
+
+
+def test_remote_mapping_autopipeline_coalesces_nested_mutations() -> None:
+    backend = _CountingBackend()
+    mapping = RemoteKVMapping(backend=backend, entry_point="ep1", sep=":")
+    try:
+        mapping["3d"] = {"a": [1, 1, 1], "b": 1}
+        row = mapping["3d"]
+        backend.writes.clear()
+
+        with mapping.autopipeline():
+            for index in range(3):
+                row["a"][index] = 0
+            row["b"] = 2
+
+        assert backend.writes == [[("ep1:3d", '{"a": [0, 0, 0], "b": 2}')]]
+    finally:
+        mapping.close()
+
+
+def test_write_through_stale_wrapper_assignment_still_persists(mapping: RemoteKVMapping) -> None:
+    mapping["k"] = {"a": 1}
+    stale = mapping["k"]
+    mapping["k"] = {"a": 6}
+
+    stale["a"] = 5
+
+    assert mapping["k"] == {"a": 5}
+
+
+def test_write_through_nested_mutation_encodes_once_without_rewalking(monkeypatch: pytest.MonkeyPatch) -> None:
+    encoded: list[object] = []
+
+    def recording_encoder(value: object) -> str:
+        encoded.append(value)
+        return json.dumps(value)
+
+    mapping = RemoteKVMapping(backend=InMemoryAsyncBackend(), entry_point="ep1", sep=":", json_encoder=recording_encoder)
+    try:
+        mapping["user"] = {"alice": {"age": 30, "tags": ["a", "b"]}}
+        user = mapping["user"]
+        encoded.clear()
+
+        to_plain_calls: list[object] = []
+        original_to_plain = remote_module._to_plain
+
+        def counting_to_plain(value: object) -> object:
+            to_plain_calls.append(value)
+            return original_to_plain(value)
+
+        monkeypatch.setattr(remote_module, "_to_plain", counting_to_plain)
+        user["alice"]["email"] = "alice@example.com"
+
+        expected = {"alice": {"age": 30, "tags": ["a", "b"], "email": "alice@example.com"}}
+        assert encoded == [expected]
+        assert to_plain_calls == ["alice@example.com"]
+        assert json.loads(mapping._bridge.run(mapping._backend.get("ep1:user"))) == expected
+    finally:
+        mapping.close()
+
+
+def test_remote_mapping_cache_keeps_persisted_value_when_write_fails() -> None:
+    backend = InMemoryAsyncBackend()
+    mapping = RemoteKVMapping(backend=backend, entry_point="ep1", sep=":", cache_size=4)
+    try:
+        mapping["k"] = {"a": 1}
+        assert mapping["k"] == {"a": 1}
+
+        with pytest.raises(TypeError):
+            mapping["k"]["bad"] = {1, 2}
+
+        assert mapping["k"] == {"a": 1}
+        assert mapping._bridge.run(backend.get("ep1:k")) == '{"a": 1}'
+    finally:
+        mapping.close()
+
+
+def test_remote_mapping_contains_and_len_do_not_decode_values() -> None:
+    decoded: list[str | bytes] = []
+
+    def counting_decoder(raw: str | bytes) -> object:
+        decoded.append(raw)
+        return json.loads(raw)
+
+    mapping = RemoteKVMapping(backend=InMemoryAsyncBackend(), entry_point="ep1", json_decoder=counting_decoder)
+    try:
+        mapping["user"] = {"name": "alice"}
+        mapping._bridge.run(mapping._backend.set("ep1:nested:child", "1"))
+
+        assert "user" in mapping
+        assert "nested" in mapping
+        assert "missing" not in mapping
+        assert 1 not in mapping
+        assert len(mapping) == len(["nested", "user"])
+        assert decoded == []
+    finally:
+        mapping.close()
+
+
+def test_remote_mapping_passes_array_columns_to_the_encoder_untouched() -> None:
+    seen: list[object] = []
+
+    def encode_array(value: object) -> list[int]:
+        assert isinstance(value, array)
+        seen.append(value)
+        return value.tolist()
+
+    backend = InMemoryAsyncBackend()
+    mapping = RemoteKVMapping(backend=backend, entry_point="ep1", json_encoder=partial(json.dumps, default=encode_array))
+    try:
+        columns = {"x": array("i", [1, 2, 3]), "y": array("i", [3, 2, 1])}
+        mapping["3d"] = columns
+
+        assert seen == [columns["x"], columns["y"]]
+        assert mapping["3d"] == {"x": [1, 2, 3], "y": [3, 2, 1]}
+    finally:
+        mapping.close()
+
+
+def test_remote_mapping_delitem_uses_a_single_bridge_round_trip(
+    mapping: RemoteKVMapping, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    mapping["user"] = {"alice": 1}
+    mapping._bridge.run(mapping._backend.set("ep1:user:bob", "2"))
+    calls: list[object] = []
+    original_run = _AsyncLoopBridge.run
+
+    def counting_run(bridge: _AsyncLoopBridge, coroutine: Any) -> Any:
+        calls.append(coroutine)
+        return original_run(bridge, coroutine)
+
+    monkeypatch.setattr(_AsyncLoopBridge, "run", counting_run)
+    del mapping["user"]
+
+    assert len(calls) == 1
+    assert mapping._bridge.run(mapping._backend.list_keys("ep1:")) == []
+    with pytest.raises(KeyError):
+        del mapping["user"]
+
+
+def test_remote_mapping_contains_many_checks_keys_in_one_round_trip(
+    mapping: RemoteKVMapping, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    mapping["user"] = {"alice": 1}
+    mapping._bridge.run(mapping._backend.set("ep1:nested:child", "2"))
+    calls: list[object] = []
+    original_run = _AsyncLoopBridge.run
+
+    def counting_run(bridge: _AsyncLoopBridge, coroutine: Any) -> Any:
+        calls.append(coroutine)
+        return original_run(bridge, coroutine)
+
+    monkeypatch.setattr(_AsyncLoopBridge, "run", counting_run)
+
+    assert mapping.contains_many(["user", "missing", "nested", "user"]) == [True, False, True, True]
+    assert len(calls) == 1
+
+
+def test_remote_mapping_setdefault_stores_missing_key_and_keeps_existing(mapping: RemoteKVMapping) -> None:
+    created = mapping.setdefault("user", {"tags": []})
+    created["tags"].append("a")
+    assert mapping["user"] == {"tags": ["a"]}
+
+    assert mapping.setdefault("user", {"tags": ["ignored"]}) == {"tags": ["a"]}
+    assert mapping.setdefault("flag") is None
+    assert mapping["flag"] is None
+
+
+def test_remote_mapping_setdefault_treats_nested_children_as_existing(mapping: RemoteKVMapping) -> None:
+    mapping._bridge.run(mapping._backend.set("ep1:user:alice", "1"))
+
+    assert mapping.setdefault("user", "ignored") == {"alice": 1}
+    assert mapping._bridge.run(mapping._backend.list_keys("ep1:")) == ["ep1:user:alice"]
+
+
+def test_remote_mapping_setdefault_with_prefetch_updates_snapshot() -> None:
+    backend = InMemoryAsyncBackend()
+    mapping = RemoteKVMapping(backend=backend, entry_point="ep1", prefetch=True)
+    try:
+        assert mapping.setdefault("user", {"alice": 1}) == {"alice": 1}
+        assert mapping["user"] == {"alice": 1}
+        assert mapping._bridge.run(backend.get("ep1:user")) == '{"alice": 1}'
+    finally:
+        mapping.close()
+
+
+def test_remote_mapping_subtree_reads_do_not_scan_sibling_keys() -> None:
+    class _PrefixRecordingBackend(InMemoryAsyncBackend):
+        def __init__(self) -> None:
+            super().__init__()
+            self.scanned: list[str] = []
+
+        async def list_keys(self, prefix: str) -> list[str]:
+            self.scanned.append(prefix)
+            return await super().list_keys(prefix)
+
+    backend = _PrefixRecordingBackend()
+    mapping = RemoteKVMapping(backend=backend, entry_point="ep1")
+    try:
+        mapping["user"] = {"alice": 1}
+        mapping["userx"] = "sibling"
+        mapping._bridge.run(backend.set("ep1:user:bob", "3"))
+        backend.scanned.clear()
+
+        assert mapping["user"] == {"alice": 1, "bob": 3}
+        assert "user" in mapping
+        del mapping["user"]
+
+        assert set(backend.scanned) == {"ep1:user:"}
+        assert mapping["userx"] == "sibling"
+    finally:
+        mapping.close()
+
+
+def test_remote_mappings_share_one_bridge_until_the_last_close() -> None:
+    first = RemoteKVMapping(backend=InMemoryAsyncBackend(), entry_point="ep1")
+    second = RemoteKVMapping(backend=InMemoryAsyncBackend(), entry_point="ep2")
+    bridge = first._bridge
+    try:
+        assert second._bridge is bridge
+
+        first.close()
+        first.close()
+        second["user"] = {"alice": 1}
+        assert second["user"] == {"alice": 1}
+        assert bridge._thread.is_alive()
+    finally:
+        second.close()
+
+    assert not bridge._thread.is_alive()
+    third = RemoteKVMapping(backend=InMemoryAsyncBackend(), entry_point="ep3")
+    try:
+        assert third._bridge is not bridge
+        third["k"] = "v"
+        assert third["k"] == "v"
+    finally:
+        third.close()
+
+
+def test_remote_mapping_context_manager_closes_on_exit() -> None:
+    closed: list[bool] = []
+
+    class _ClosingBackend(InMemoryAsyncBackend):
+        @override
+        async def close(self) -> None:
+            closed.append(True)
+
+    with RemoteKVMapping(backend=_ClosingBackend(), entry_point="ep1") as test_mapping:
+        test_mapping["a"] = 1
+        assert closed == []
+
+    assert closed == [True]
+    test_mapping.close()
+    assert closed == [True]
+
+
+def test_remote_mapping_caches_keys_until_local_write_or_refresh() -> None:
+    backend = InMemoryAsyncBackend()
+    mapping = RemoteKVMapping(backend=backend, entry_point="ep1", cache_size=8)
+    try:
+        mapping["a"] = 1
+        assert list(mapping) == ["a"]
+
+        mapping._bridge.run(backend.set("ep1:external", '"x"'))
+        assert list(mapping) == ["a"]
+        assert mapping["a"] == 1
+
+        mapping["b"] = 2
+        assert list(mapping) == ["a", "b", "external"]
+
+        mapping._bridge.run(backend.set("ep1:a", '"changed"'))
+        mapping._bridge.run(backend.delete("ep1:external"))
+        assert mapping["a"] == 1
+        mapping.refresh()
+        assert list(mapping) == ["a", "b"]
+        assert mapping["a"] == "changed"
     finally:
         mapping.close()
+
+
+def test_remote_mapping_repr_reads_all_values_in_one_round_trip(
+    mapping: RemoteKVMapping, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    mapping.update({"a": 1, "b": {"c": 2}, "d": [3]})
+    calls: list[object] = []
+    original_run = _AsyncLoopBridge.run
+
+    def counting_run(bridge: _AsyncLoopBridge, coroutine: Any) -> Any:
+        calls.append(coroutine)
+        return original_run(bridge, coroutine)
+
+    monkeypatch.setattr(_AsyncLoopBridge, "run", counting_run)
+
+    assert repr(mapping) == "{'a': 1, 'b': {'c': 2}, 'd': [3]}"
+    assert len(calls) == 1
+
+
+def test_remote_mapping_flatten_on_write_stores_one_key_per_leaf() -> None:
+    backend = InMemoryAsyncBackend()
+    test_mapping = RemoteKVMapping(backend=backend, entry_point="ep1", flatten_on_write=True)
+    try:
+        test_mapping["cfg"] = {"db": {"host": "h", "port": 5432}, "tags": ["a"], "empty": {}, "odd": {"a:b": 1}}
+
+        assert asyncio.run(backend.list_keys("ep1:")) == [
+            "ep1:cfg:db:host",
+            "ep1:cfg:db:port",
+            "ep1:cfg:empty",
+            "ep1:cfg:odd",
+            "ep1:cfg:tags",
+        ]
+        assert test_mapping["cfg"] == {"db": {"host": "h", "port": 5432}, "tags": ["a"], "empty": {}, "odd": {"a:b": 1}}
+
+        test_mapping["cfg"]["db"]["host"] = "h2"
+        assert asyncio.run(backend.get("ep1:cfg:db:host")) == json.dumps("h2")
+    finally:
+        test_mapping.close()
+
+
+def test_remote_mapping_flatten_on_write_removes_stale_leaves() -> None:
+    backend = InMemoryAsyncBackend()
+    test_mapping = RemoteKVMapping(backend=backend, entry_point="ep1", flatten_on_write=True, prefetch=True)
+    try:
+        test_mapping["cfg"] = {"a": 1, "b": {"c": 2}}
+        test_mapping["cfg"] = {"a": 3}
+        assert asyncio.run(backend.list_keys("ep1:")) == ["ep1:cfg:a"]
+        assert test_mapping["cfg"] == {"a": 3}
+
+        test_mapping["cfg"] = "flat"
+        assert asyncio.run(backend.list_keys("ep1:")) == ["ep1:cfg"]
+        assert test_mapping["cfg"] == "flat"
+
+        with test_mapping.autopipeline():
+            test_mapping["cfg"] = {"x": {"y": True}}
+        assert asyncio.run(backend.list_keys("ep1:")) == ["ep1:cfg:x:y"]
+        assert test_mapping["cfg"] == {"x": {"y": True}}
+    finally:
+        test_mapping.close()
+
+
+def test_remote_mapping_flatten_on_write_persists_mutations_per_leaf() -> None:
+    encoded: list[object] = []
+
+    def recording_encoder(value: object) -> str:
+        encoded.append(value)
+        return json.dumps(value)
+
+    backend = InMemoryAsyncBackend()
+    test_mapping = RemoteKVMapping(
+        backend=backend, entry_point="ep1", json_encoder=recording_encoder, flatten_on_write=True, prefetch=True
+    )
+    try:
+        test_mapping["cfg"] = {"db": {"host": "h", "port": "5432"}, "tags": ["a"], "empty": {}}
+        cfg = test_mapping["cfg"]
+        encoded.clear()
+
+        cfg["db"]["host"] = "h2"
+        cfg["tags"].append("b")
+        cfg["empty"]["x"] = {"y": "z"}
+        del cfg["db"]["port"]
+        assert encoded == ["h2", ["a", "b"], "z"]
+
+        del cfg["db"]["host"]
+        cfg["db"]["a:b"] = "odd"
+        assert asyncio.run(backend.list_keys("ep1:")) == ["ep1:cfg:db", "ep1:cfg:empty:x:y", "ep1:cfg:tags"]
+
+        expected = {"db": {"a:b": "odd"}, "tags": ["a", "b"], "empty": {"x": {"y": "z"}}}
+        assert test_mapping["cfg"] == expected
+        test_mapping.refresh()
+        assert test_mapping["cfg"] == expected
+    finally:
+        test_mapping.close()
+
+
+def test_to_plain_copies_shared_subtrees_once() -> None:
+    shared: dict[str, Any] = {"leaf": "x"}
+    for _ in range(64):
+        shared = {"left": shared, "right": [shared]}
+
+    plain = remote_module._to_plain(_WriteThroughDict(shared, lambda _path: None), {})
+
+    assert plain is not shared
+    assert plain["left"] is plain["right"][0]
+    assert plain["left"] is not shared["left"]
+    assert remote_module._to_plain({"a": [1], "b": ({"c": 2},)}) == {"a": [1], "b": ({"c": 2},)}
+
+
+def test_remote_mapping_ignores_keys_a_loose_backend_matches_by_pattern() -> None:
+    backend = _LooseLikeBackend()
+    test_mapping = RemoteKVMapping(backend=backend, entry_point="app")
+    try:
+        asyncio.run(backend.set("app:userX1:extra", json.dumps("keep-me")))
+        test_mapping["user_1"] = {"name": "mine"}
+
+        assert test_mapping["user_1"] == {"name": "mine"}
+        del test_mapping["user_1"]
+        assert asyncio.run(backend.list_keys("app:")) == ["app:userX1:extra"]
+    finally:
+        test_mapping.close()
+
+
+def test_remote_mapping_iteration_ignores_other_entry_points_a_loose_backend_matches() -> None:
+    backend = _LooseLikeBackend()
+    other = RemoteKVMapping(backend=backend, entry_point="myXapp")
+    test_mapping = RemoteKVMapping(backend=backend, entry_point="my_app")
+    try:
+        other["secret"] = 1
+        test_mapping["a"] = 2
+
+        assert list(test_mapping) == ["a"]
+        assert len(test_mapping) == 1
+        assert repr(test_mapping) == "{'a': 2}"
+    finally:
+        test_mapping.close()
+        other.close()
+
+
+def test_remote_mapping_prefetch_ignores_other_entry_points_a_loose_backend_matches() -> None:
+    backend = _LooseLikeBackend()
+    other = RemoteKVMapping(backend=backend, entry_point="myXapp")
+    other["secret"] = 1
+    asyncio.run(backend.set("my_app:a", json.dumps(2)))
+    test_mapping = RemoteKVMapping(backend=backend, entry_point="my_app", prefetch=True)
+    try:
+        assert list(test_mapping) == ["a"]
+        assert test_mapping.copy() == {"a": 2}
+    finally:
+        test_mapping.close()
+        other.close()
+
+
+class _GetCountingBackend(InMemoryAsyncBackend):
+    def __init__(self) -> None:
+        super().__init__()
+        self.gets: list[str] = []
+
+    @override
+    async def get(self, key: str) -> str | bytes | None:
+        self.gets.append(key)
+        return await super().get(key)
+
+
+def test_remote_mapping_membership_never_reads_values() -> None:
+    backend = _GetCountingBackend()
+    test_mapping = RemoteKVMapping(backend=backend, entry_point="ep1")
+    try:
+        test_mapping["user"] = {"name": "alice"}
+        asyncio.run(backend.set("ep1:nested:child", "1"))
+
+        assert "user" in test_mapping
+        assert test_mapping.contains_many(["user", "nested", "missing"]) == [True, True, False]
+        assert backend.gets == []
+    finally:
+        test_mapping.close()
+
+
+class _ListingCountingBackend(InMemoryAsyncBackend):
+    def __init__(self) -> None:
+        super().__init__()
+        self.listings: list[str] = []
+
+    @override
+    async def list_keys(self, prefix: str) -> list[str]:
+        self.listings.append(prefix)
+        return await super().list_keys(prefix)
+
+
+def test_remote_mapping_flattened_leaf_mutations_do_not_list_the_backend() -> None:
+    backend = _ListingCountingBackend()
+    test_mapping = RemoteKVMapping(backend=backend, entry_point="ep1", flatten_on_write=True)
+    try:
+        test_mapping["cfg"] = {"db": {"host": "h", "port": "1"}}
+        cfg = test_mapping["cfg"]
+        backend.listings.clear()
+
+        cfg["db"]["host"] = "h2"
+        cfg["db"]["port"] = {"a": "1", "b": "2"}
+        cfg["db"]["port"] = "3"
+
+        assert backend.listings == []
+        assert asyncio.run(backend.list_keys("ep1:")) == ["ep1:cfg:db:host", "ep1:cfg:db:port"]
+    finally:
+        test_mapping.close()
+
+
+def test_remote_mapping_flattened_mutations_of_values_stored_whole() -> None:
+    backend = InMemoryAsyncBackend()
+    test_mapping = RemoteKVMapping(backend=backend, entry_point="ep1", flatten_on_write=True, cache_size=8)
+    try:
+        test_mapping["odd"] = {"a:b": 1, "c": 2}
+        del test_mapping["odd"]["a:b"]
+        assert test_mapping["odd"] == {"c": 2}
+
+        defaulted = test_mapping.setdefault("k", {"a": 1, "b": 1})
+        del defaulted["a"]
+        assert asyncio.run(backend.list_keys("ep1:k")) == ["ep1:k:b"]
+        assert test_mapping["k"] == {"b": 1}
+
+        asyncio.run(backend.set("ep1:legacy", json.dumps({"x": {"y": 1}, "z": 2})))
+        legacy = test_mapping["legacy"]
+        legacy["x"]["y"] = 3
+        assert asyncio.run(backend.list_keys("ep1:legacy")) == ["ep1:legacy:x:y", "ep1:legacy:z"]
+        assert test_mapping["legacy"] == {"x": {"y": 3}, "z": 2}
+    finally:
+        test_mapping.close()
+
+
+def test_write_through_assignment_does_not_alias_shared_subtrees(mapping: RemoteKVMapping) -> None:
+    mapping["k"] = {}
+    shared = {"v": 1}
+    wrapper = mapping["k"]
+    wrapper["p"] = {"x": shared, "y": shared}
+
+    wrapper["p"]["x"]["v"] = 2
+
+    assert wrapper == {"p": {"x": {"v": 2}, "y": {"v": 1}}}
+    assert mapping["k"] == {"p": {"x": {"v": 2}, "y": {"v": 1}}}
+
+
+class _RacingBackend(InMemoryAsyncBackend):
+    """Backend that runs a hook, standing in for a concurrent writer, just after a read fetched its value."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.after_get: list[Any] = []
+
+    @override
+    async def get(self, key: str) -> str | bytes | None:
+        value = await super().get(key)
+        while self.after_get:
+            self.after_get.pop()()
+        return value
+
+
+def test_remote_mapping_does_not_cache_a_read_that_raced_a_write() -> None:
+    backend = _RacingBackend()
+    test_mapping = RemoteKVMapping(backend=backend, entry_point="ep1", cache_size=8)
+    try:
+        test_mapping["k"] = "old"
+
+        def concurrent_write() -> None:
+            backend._store["ep1:k"] = json.dumps("new")
+            test_mapping._invalidate("ep1:k")
+
+        backend.after_get.append(concurrent_write)
+        assert test_mapping["k"] == "old"
+        assert test_mapping["k"] == "new"
+    finally:
+        test_mapping.close()
+
+
+def test_remote_mapping_whole_mapping_reads_scan_the_prefix_once() -> None:
+    backend = _ListingCountingBackend()
+    test_mapping = RemoteKVMapping(backend=backend, entry_point="ep1")
+    try:
+        test_mapping.update({"a": 1, "b": {"c": 2}})
+        asyncio.run(backend.set("ep1:b:d", json.dumps(3)))
+        backend.listings.clear()
+
+        assert test_mapping.copy() == {"a": 1, "b": {"c": 2, "d": 3}}
+        assert str(test_mapping) == "{'a': 1, 'b': {'c': 2, 'd': 3}}"
+        assert backend.listings == ["ep1:", "ep1:"]
+    finally:
+        test_mapping.close()
+
+
+def test_remote_mapping_whole_mapping_reads_are_served_from_a_full_cache() -> None:
+    backend = _ListingCountingBackend()
+    test_mapping = RemoteKVMapping(backend=backend, entry_point="ep1", cache_size=8)
+    try:
+        test_mapping.update({"a": 1, "b": {"c": 2}})
+        backend.listings.clear()
+
+        first = test_mapping.copy()
+        first["b"]["c"] = 99
+        assert test_mapping.copy() == {"a": 1, "b": {"c": 2}}
+        assert repr(test_mapping) == "{'a': 1, 'b': {'c': 2}}"
+        assert backend.listings == ["ep1:"]
+
+        test_mapping["d"] = 3
+        assert test_mapping.copy() == {"a": 1, "b": {"c": 2}, "d": 3}
+        assert backend.listings == ["ep1:", "ep1:"]
+    finally:
+        test_mapping.close()
+
+
+class _CountingTopLevelBackend(InMemoryAsyncBackend):
+    def __init__(self) -> None:
+        super().__init__()
+        self.counted: list[str] = []
+
+    @override
+    async def count_top_level(self, prefix: str, sep: str) -> int:
+        self.counted.append(prefix)
+        return len({key[len(prefix) :].split(sep, 1)[0] for key in await self.list_keys(prefix)})
+
+    @override
+    async def list_top_level(self, prefix: str, sep: str) -> list[str]:
+        raise AssertionError
+
+
+def test_remote_mapping_len_asks_the_backend_for_a_count() -> None:
+    backend = _CountingTopLevelBackend()
+    test_mapping = RemoteKVMapping(backend=backend, entry_point="ep1")
+    try:
+        asyncio.run(backend.set_many([("ep1:a", "1"), ("ep1:b:c", "2"), ("ep1:b:d", "3")]))
+
+        assert len(test_mapping) == len(["a", "b"])
+        assert backend.counted == ["ep1:"]
+    finally:
+        test_mapping.close()